@@ -3,11 +3,22 @@ Configuration settings for MediTrack EMS Aircraft Tracking System.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _load_env() -> Dict[str, str]:
+    """Load the .env file once per process and snapshot the environment."""
+    # load_dotenv() still populates os.environ for modules that read it directly
+    load_dotenv()
+    return dict(os.environ)
+
+
+# Environment variables (including .env values)
+_ENV = _load_env()
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent
@@ -25,50 +36,50 @@ POLICE_DB_JSON = DATA_DIR / "police_aircraft.json"
 CACHE_DIR = DATA_DIR / "cache"
 
 # OpenSky API configuration
-OPENSKY_USERNAME = os.getenv("OPENSKY_USERNAME", None)
-OPENSKY_PASSWORD = os.getenv("OPENSKY_PASSWORD", None)
-OPENSKY_CLIENT_ID = os.getenv("OPENSKY_CLIENT_ID", None)
-OPENSKY_CLIENT_SECRET = os.getenv("OPENSKY_CLIENT_SECRET", None)
+OPENSKY_USERNAME = _ENV.get("OPENSKY_USERNAME", None)
+OPENSKY_PASSWORD = _ENV.get("OPENSKY_PASSWORD", None)
+OPENSKY_CLIENT_ID = _ENV.get("OPENSKY_CLIENT_ID", None)
+OPENSKY_CLIENT_SECRET = _ENV.get("OPENSKY_CLIENT_SECRET", None)
 
 # Rate limiting settings
 # Anonymous users: ~10 requests/second (conservative)
 # Authenticated users: Better rate limits
-OPENSKY_RATE_LIMIT_CALLS = int(os.getenv("OPENSKY_RATE_LIMIT_CALLS", "10"))
-OPENSKY_RATE_LIMIT_PERIOD = float(os.getenv("OPENSKY_RATE_LIMIT_PERIOD", "1.0"))
+OPENSKY_RATE_LIMIT_CALLS = int(_ENV.get("OPENSKY_RATE_LIMIT_CALLS", "10"))
+OPENSKY_RATE_LIMIT_PERIOD = float(_ENV.get("OPENSKY_RATE_LIMIT_PERIOD", "1.0"))
 
 # Cache settings
-CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-CACHE_MAX_AGE_SECONDS = int(os.getenv("CACHE_MAX_AGE_SECONDS", "60"))
+CACHE_ENABLED = _ENV.get("CACHE_ENABLED", "true").lower() == "true"
+CACHE_MAX_AGE_SECONDS = int(_ENV.get("CACHE_MAX_AGE_SECONDS", "60"))
 
 # Filtering settings
-EXCLUDE_INDIVIDUAL_OWNERS = os.getenv("EXCLUDE_INDIVIDUAL_OWNERS", "false").lower() == "true"
-MIN_CONFIDENCE_LEVEL = os.getenv("MIN_CONFIDENCE_LEVEL", "low")  # 'low', 'medium', 'high'
+EXCLUDE_INDIVIDUAL_OWNERS = _ENV.get("EXCLUDE_INDIVIDUAL_OWNERS", "false").lower() == "true"
+MIN_CONFIDENCE_LEVEL = _ENV.get("MIN_CONFIDENCE_LEVEL", "low")  # 'low', 'medium', 'high'
 
 # Regional tracking settings
 # Options: 'northeast', 'midwest', 'south', 'west', 'all', or None (prompts interactively)
-TRACKING_REGION = os.getenv("TRACKING_REGION", None)
+TRACKING_REGION = _ENV.get("TRACKING_REGION", None)
 
 # Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
 
 # Monitoring settings
-MONITOR_INTERVAL_SECONDS = int(os.getenv("MONITOR_INTERVAL_SECONDS", "60"))
-MONITOR_REGION = os.getenv("MONITOR_REGION", None)  # 'northeast', 'midwest', 'south', 'west', 'all'
-MONITOR_STATE = os.getenv("MONITOR_STATE", None)  # Comma-separated state codes (e.g., 'NJ' or 'NJ,DE,PA')
+MONITOR_INTERVAL_SECONDS = int(_ENV.get("MONITOR_INTERVAL_SECONDS", "60"))
+MONITOR_REGION = _ENV.get("MONITOR_REGION", None)  # 'northeast', 'midwest', 'south', 'west', 'all'
+MONITOR_STATE = _ENV.get("MONITOR_STATE", None)  # Comma-separated state codes (e.g., 'NJ' or 'NJ,DE,PA')
 
 # Anomaly detection thresholds
-ANOMALY_SPEED_THRESHOLD_KNOTS = float(os.getenv("ANOMALY_SPEED_THRESHOLD_KNOTS", "150.0"))
-ANOMALY_MULTI_LAUNCH_WINDOW_SECONDS = int(os.getenv("ANOMALY_MULTI_LAUNCH_WINDOW_SECONDS", "300"))
-ANOMALY_RAPID_CLIMB_RATE_FT_MIN = float(os.getenv("ANOMALY_RAPID_CLIMB_RATE_FT_MIN", "2000.0"))
-ANOMALY_RAPID_DESCENT_FT = float(os.getenv("ANOMALY_RAPID_DESCENT_FT", "1000.0"))
-ANOMALY_RAPID_DESCENT_WINDOW_SECONDS = int(os.getenv("ANOMALY_RAPID_DESCENT_WINDOW_SECONDS", "30"))
+ANOMALY_SPEED_THRESHOLD_KNOTS = float(_ENV.get("ANOMALY_SPEED_THRESHOLD_KNOTS", "150.0"))
+ANOMALY_MULTI_LAUNCH_WINDOW_SECONDS = int(_ENV.get("ANOMALY_MULTI_LAUNCH_WINDOW_SECONDS", "300"))
+ANOMALY_RAPID_CLIMB_RATE_FT_MIN = float(_ENV.get("ANOMALY_RAPID_CLIMB_RATE_FT_MIN", "2000.0"))
+ANOMALY_RAPID_DESCENT_FT = float(_ENV.get("ANOMALY_RAPID_DESCENT_FT", "1000.0"))
+ANOMALY_RAPID_DESCENT_WINDOW_SECONDS = int(_ENV.get("ANOMALY_RAPID_DESCENT_WINDOW_SECONDS", "30"))
 
 # Anomaly logging
-ANOMALY_LOG_FILE = Path(DATA_DIR) / os.getenv("ANOMALY_LOG_FILE", "anomalies.jsonl")
-MONITOR_STATE_DB = Path(DATA_DIR) / os.getenv("MONITOR_STATE_DB", "monitor_state.db")
+ANOMALY_LOG_FILE = Path(DATA_DIR) / _ENV.get("ANOMALY_LOG_FILE", "anomalies.jsonl")
+MONITOR_STATE_DB = Path(DATA_DIR) / _ENV.get("MONITOR_STATE_DB", "monitor_state.db")
 
 # Geographic context (airports, hospitals) for anomaly suppression and enrichment
-AIRPORTS_CSV = PROJECT_ROOT / os.getenv("AIRPORTS_CSV", "us-airports.csv")
-HOSPITALS_CSV = PROJECT_ROOT / os.getenv("HOSPITALS_CSV", "Hospitals.csv")
-GEO_NEAR_AIRPORT_KM = float(os.getenv("GEO_NEAR_AIRPORT_KM", "10"))
-GEO_NEAR_HOSPITAL_KM = float(os.getenv("GEO_NEAR_HOSPITAL_KM", "10"))
\ No newline at end of file
+AIRPORTS_CSV = PROJECT_ROOT / _ENV.get("AIRPORTS_CSV", "us-airports.csv")
+HOSPITALS_CSV = PROJECT_ROOT / _ENV.get("HOSPITALS_CSV", "Hospitals.csv")
+GEO_NEAR_AIRPORT_KM = float(_ENV.get("GEO_NEAR_AIRPORT_KM", "10"))
+GEO_NEAR_HOSPITAL_KM = float(_ENV.get("GEO_NEAR_HOSPITAL_KM", "10"))
\ No newline at end of file
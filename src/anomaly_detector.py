@@ -4,14 +4,78 @@ Anomaly detection engine for EMS aircraft monitoring.
 Detects unusual flight patterns that may indicate emergencies.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 from datetime import datetime, timedelta
+import bisect
 import math
 
+# Unit conversions (OpenSky reports SI units)
+MS_TO_KT: Final = 1.94384      # m/s -> knots
+MS_TO_FT_MIN: Final = 196.85   # m/s -> ft/min
+M_TO_FT: Final = 3.28084       # m -> ft
+
+# Fixed detection limits, pre-converted to SI so comparisons need no conversion
+SPEED_INCREASE_MIN_MS: Final = 30 / MS_TO_KT        # 30 kt minimum current speed
+SPEED_INCREASE_MIN_DELTA_MS: Final = 20 / MS_TO_KT  # 20 kt minimum absolute increase
+HOVER_MIN_ALTITUDE_M: Final = 5000 / M_TO_FT        # 5000 ft
+HOVER_MAX_VELOCITY_MS: Final = 30 / MS_TO_KT        # 30 kt
+
+
+def _anomaly(icao24: Optional[str], anomaly_type: str, severity: str, details: Dict) -> Dict:
+    """
+    Build an anomaly record.
+    
+    Anomalies stay plain dicts: the monitor service, notifier and GUI read
+    them with .get() and annotate them in place (aircraft_info, geo details).
+    """
+    return {'icao24': icao24, 'type': anomaly_type, 'severity': severity, 'details': details}
+
+
+def state_altitude(state: Dict) -> Optional[float]:
+    """
+    Return a state's altitude in metres (barometric, falling back to geometric).
+    
+    The value is memoized on the state dict under 'altitude_m', so repeated
+    lookups of the same state (e.g. history entries) resolve it only once.
+    """
+    try:
+        return state['altitude_m']
+    except KeyError:
+        altitude = state['altitude_m'] = state.get('baro_altitude') or state.get('geo_altitude')
+        return altitude
+
+
+def _state_time(state: Dict) -> float:
+    """Return the time of a state (last contact, falling back to poll timestamp)."""
+    return state.get('last_contact') or state.get('timestamp', 0)
+
+
+def _states_since(history: List[Dict], cutoff_time: float) -> List[Dict]:
+    """
+    Return the states in a time-ordered history at or after cutoff_time.
+    
+    Works for both most-recent-first (StateTracker) and oldest-first order,
+    locating the window boundary by binary search.
+    """
+    if not history:
+        return history
+    if _state_time(history[0]) >= _state_time(history[-1]):
+        # Most recent first: the window is a prefix
+        end = bisect.bisect_right(history, -cutoff_time, key=lambda h: -_state_time(h))
+        return history[:end]
+    start = bisect.bisect_left(history, cutoff_time, key=_state_time)
+    return history[start:]
+
 
 class AnomalyDetector:
     """Detects anomalies in aircraft flight patterns."""
     
+    __slots__ = (
+        'speed_threshold_knots', 'multi_launch_window_seconds', 'rapid_climb_rate_ft_min',
+        'rapid_descent_ft', 'rapid_descent_window_seconds',
+        '_speed_threshold_ms', '_rapid_climb_ms', 'emergency_squawks'
+    )
+    
     def __init__(self, 
                  speed_threshold_knots: float = 150.0,
                  multi_launch_window_seconds: int = 300,
@@ -34,6 +98,11 @@ class AnomalyDetector:
         self.rapid_descent_ft = rapid_descent_ft
         self.rapid_descent_window_seconds = rapid_descent_window_seconds
         
+        # Thresholds in native (SI) units so the per-aircraft comparison needs
+        # no conversion; values are only converted for flagged aircraft
+        self._speed_threshold_ms = speed_threshold_knots / MS_TO_KT
+        self._rapid_climb_ms = rapid_climb_rate_ft_min / MS_TO_FT_MIN
+        
         # Emergency squawk codes
         self.emergency_squawks = {
             '7500': 'hijack',
@@ -47,6 +116,10 @@ class AnomalyDetector:
         """
         Detect anomalies in current aircraft states.
         
+        All per-aircraft checks run in a single pass: each state's fields are
+        read once and the heavier history checks only run when their cheap
+        preconditions hold.
+        
         Args:
             current_states: Dictionary mapping icao24 to current state
             previous_states: Dictionary mapping icao24 to previous state
@@ -56,19 +129,43 @@ class AnomalyDetector:
             List of anomaly dictionaries with keys: icao24, type, severity, details
         """
         anomalies = []
+        launches = []
+        launch_times = []
+        
+        # Bind the per-aircraft callables once; the loop runs for every
+        # tracked aircraft on every poll
+        check_speed = self._check_speed
+        check_altitude = self._check_altitude
+        check_squawk = self._check_squawk
+        check_pattern = self._check_pattern
+        get_history = state_history.get
+        get_previous = previous_states.get
         
         for icao24, current_state in current_states.items():
-            previous_state = previous_states.get(icao24)
-            history = state_history.get(icao24, [])
+            get = current_state.get
+            history = get_history(icao24, [])
+            velocity_ms = get('velocity')
+            vertical_rate = get('vertical_rate')
+            altitude = state_altitude(current_state)
+            squawk = get('squawk')
+            
+            if velocity_ms is not None:
+                check_speed(anomalies, icao24, velocity_ms, history)
+            if vertical_rate is not None or (altitude is not None and history):
+                check_altitude(anomalies, icao24, current_state, altitude, vertical_rate, history)
+            if squawk:
+                check_squawk(anomalies, icao24, current_state, squawk)
+            if len(history) >= 3:
+                check_pattern(anomalies, icao24, history)
             
-            # Check each type of anomaly
-            anomalies.extend(self.check_speed_anomaly(icao24, current_state, previous_state, history))
-            anomalies.extend(self.check_altitude_anomaly(icao24, current_state, previous_state, history))
-            anomalies.extend(self.check_emergency_squawk(icao24, current_state))
-            anomalies.extend(self.check_flight_pattern(icao24, current_state, history))
+            # Collect ground-to-air transitions for the multi-launch check
+            previous_state = get_previous(icao24)
+            if previous_state and previous_state.get('on_ground') and not get('on_ground'):
+                launches.append({'icao24': icao24, 'callsign': get('callsign')})
+                launch_times.append(_state_time(current_state))
         
         # Multi-aircraft anomalies (check across all aircraft)
-        anomalies.extend(self.check_multiple_launch(current_states, previous_states))
+        self._check_launches(anomalies, launches, launch_times)
         
         return anomalies
     
@@ -85,64 +182,8 @@ class AnomalyDetector:
         """
         anomalies = []
         velocity_ms = current_state.get('velocity')
-        
-        if velocity_ms is None:
-            return anomalies
-        
-        # Convert m/s to knots
-        velocity_knots = velocity_ms * 1.94384
-        
-        # Check absolute speed threshold
-        if velocity_knots > self.speed_threshold_knots:
-            anomalies.append({
-                'icao24': icao24,
-                'type': 'high_speed',
-                'severity': 'HIGH',
-                'details': {
-                    'velocity_knots': round(velocity_knots, 1),
-                    'threshold_knots': self.speed_threshold_knots,
-                    'velocity_ms': round(velocity_ms, 1)
-                }
-            })
-        
-        # Check for sudden speed increase using recent history
-        # Look at states from last 2-3 minutes to get a better baseline
-        if len(history) >= 2:
-            # Get average velocity from 2-4 polls ago (2-4 minutes ago)
-            # This gives us a better baseline than just the previous poll
-            baseline_states = history[-4:-1] if len(history) >= 4 else history[:-1]
-            baseline_velocities = [
-                h.get('velocity', 0) for h in baseline_states 
-                if h.get('velocity') is not None and h.get('velocity', 0) > 0
-            ]
-            
-            if baseline_velocities:
-                # Use average of baseline velocities
-                avg_baseline_ms = sum(baseline_velocities) / len(baseline_velocities)
-                avg_baseline_knots = avg_baseline_ms * 1.94384
-                
-                # Only flag if there's a significant increase from baseline
-                # and current speed is above a minimum threshold (avoid false positives from low speeds)
-                if avg_baseline_ms > 0 and velocity_knots > 30:  # At least 30 knots current speed
-                    speed_increase_pct = ((velocity_ms - avg_baseline_ms) / avg_baseline_ms) * 100
-                    
-                    # Require larger increase for detection (60% instead of 50%)
-                    # and absolute increase of at least 20 knots
-                    absolute_increase_knots = velocity_knots - avg_baseline_knots
-                    if speed_increase_pct > 60 and absolute_increase_knots > 20:
-                        anomalies.append({
-                            'icao24': icao24,
-                            'type': 'sudden_speed_increase',
-                            'severity': 'MEDIUM',
-                            'details': {
-                                'baseline_velocity_knots': round(avg_baseline_knots, 1),
-                                'current_velocity_knots': round(velocity_knots, 1),
-                                'increase_percent': round(speed_increase_pct, 1),
-                                'absolute_increase_knots': round(absolute_increase_knots, 1),
-                                'baseline_samples': len(baseline_velocities)
-                            }
-                        })
-        
+        if velocity_ms is not None:
+            self._check_speed(anomalies, icao24, velocity_ms, history)
         return anomalies
     
     def check_altitude_anomaly(self, icao24: str, current_state: Dict,
@@ -155,52 +196,12 @@ class AnomalyDetector:
             List of anomaly dictionaries
         """
         anomalies = []
-        current_altitude = current_state.get('baro_altitude') or current_state.get('geo_altitude')
-        vertical_rate = current_state.get('vertical_rate')
-        
-        if vertical_rate is not None:
-            # Convert m/s to ft/min
-            vertical_rate_ft_min = vertical_rate * 196.85
-            
-            # Check for rapid climb
-            if vertical_rate_ft_min > self.rapid_climb_rate_ft_min:
-                anomalies.append({
-                    'icao24': icao24,
-                    'type': 'rapid_climb',
-                    'severity': 'HIGH',
-                    'details': {
-                        'vertical_rate_ft_min': round(vertical_rate_ft_min, 0),
-                        'threshold_ft_min': self.rapid_climb_rate_ft_min,
-                        'altitude_ft': round(current_altitude * 3.28084, 0) if current_altitude else None
-                    }
-                })
-        
-        # Check for rapid descent (compare with recent history)
-        if current_altitude is not None and len(history) > 0:
-            # Find state from rapid_descent_window_seconds ago
-            current_time = current_state.get('last_contact') or current_state.get('timestamp', 0)
-            cutoff_time = current_time - self.rapid_descent_window_seconds
-            
-            for past_state in history:
-                past_time = past_state.get('last_contact') or past_state.get('timestamp', 0)
-                if past_time >= cutoff_time:
-                    past_altitude = past_state.get('baro_altitude') or past_state.get('geo_altitude')
-                    if past_altitude is not None:
-                        altitude_drop_ft = (past_altitude - current_altitude) * 3.28084
-                        if altitude_drop_ft > self.rapid_descent_ft:
-                            anomalies.append({
-                                'icao24': icao24,
-                                'type': 'rapid_descent',
-                                'severity': 'CRITICAL',
-                                'details': {
-                                    'altitude_drop_ft': round(altitude_drop_ft, 0),
-                                    'previous_altitude_ft': round(past_altitude * 3.28084, 0),
-                                    'current_altitude_ft': round(current_altitude * 3.28084, 0),
-                                    'time_window_seconds': self.rapid_descent_window_seconds
-                                }
-                            })
-                            break  # Only report once per descent
-        
+        self._check_altitude(
+            anomalies, icao24, current_state,
+            state_altitude(current_state),
+            current_state.get('vertical_rate'),
+            history
+        )
         return anomalies
     
     def check_emergency_squawk(self, icao24: str, current_state: Dict) -> List[Dict]:
@@ -212,20 +213,8 @@ class AnomalyDetector:
         """
         anomalies = []
         squawk = current_state.get('squawk')
-        
-        if squawk and str(squawk) in self.emergency_squawks:
-            squawk_type = self.emergency_squawks[str(squawk)]
-            anomalies.append({
-                'icao24': icao24,
-                'type': f'emergency_squawk_{squawk_type}',
-                'severity': 'CRITICAL',
-                'details': {
-                    'squawk_code': str(squawk),
-                    'squawk_type': squawk_type,
-                    'callsign': current_state.get('callsign')
-                }
-            })
-        
+        if squawk:
+            self._check_squawk(anomalies, icao24, current_state, squawk)
         return anomalies
     
     def check_flight_pattern(self, icao24: str, current_state: Dict,
@@ -237,60 +226,150 @@ class AnomalyDetector:
             List of anomaly dictionaries
         """
         anomalies = []
+        if len(history) >= 3:
+            self._check_pattern(anomalies, icao24, history)
+        return anomalies
+    
+    def _check_speed(self, anomalies: List[Dict], icao24: str, velocity_ms: float,
+                     history: List[Dict]) -> None:
+        """Append high-speed and sudden-speed-increase anomalies."""
+        # Check absolute speed threshold
+        if velocity_ms > self._speed_threshold_ms:
+            anomalies.append(_anomaly(icao24, 'high_speed', 'HIGH', {
+                'velocity_knots': round(velocity_ms * MS_TO_KT, 1),
+                'threshold_knots': self.speed_threshold_knots,
+                'velocity_ms': round(velocity_ms, 1)
+            }))
         
-        if len(history) < 3:
-            return anomalies
+        # Check for sudden speed increase using recent history
+        # Look at states from last 2-3 minutes to get a better baseline
+        if len(history) >= 2:
+            # Get average velocity from 2-4 polls ago (2-4 minutes ago)
+            # This gives us a better baseline than just the previous poll
+            baseline_sum = 0.0
+            baseline_samples = 0
+            for i in range(max(len(history) - 4, 0), len(history) - 1):
+                v = history[i].get('velocity')
+                if v is not None and v > 0:
+                    baseline_sum += v
+                    baseline_samples += 1
+            
+            if baseline_samples:
+                # Use average of baseline velocities
+                avg_baseline_ms = baseline_sum / baseline_samples
+                
+                # Only flag if there's a significant increase from baseline
+                # and current speed is above a minimum threshold (avoid false positives from low speeds)
+                if avg_baseline_ms > 0 and velocity_ms > SPEED_INCREASE_MIN_MS:  # At least 30 knots current speed
+                    speed_increase_pct = ((velocity_ms - avg_baseline_ms) / avg_baseline_ms) * 100
+                    
+                    # Require larger increase for detection (60% instead of 50%)
+                    # and absolute increase of at least 20 knots
+                    if (speed_increase_pct > 60
+                            and velocity_ms - avg_baseline_ms > SPEED_INCREASE_MIN_DELTA_MS):
+                        avg_baseline_knots = avg_baseline_ms * MS_TO_KT
+                        velocity_knots = velocity_ms * MS_TO_KT
+                        anomalies.append(_anomaly(icao24, 'sudden_speed_increase', 'MEDIUM', {
+                            'baseline_velocity_knots': round(avg_baseline_knots, 1),
+                            'current_velocity_knots': round(velocity_knots, 1),
+                            'increase_percent': round(speed_increase_pct, 1),
+                            'absolute_increase_knots': round(velocity_knots - avg_baseline_knots, 1),
+                            'baseline_samples': baseline_samples
+                        }))
+    
+    def _check_altitude(self, anomalies: List[Dict], icao24: str, current_state: Dict,
+                        current_altitude: Optional[float], vertical_rate: Optional[float],
+                        history: List[Dict]) -> None:
+        """Append rapid-climb and rapid-descent anomalies."""
+        # Check for rapid climb
+        if vertical_rate is not None and vertical_rate > self._rapid_climb_ms:
+            vertical_rate_ft_min = vertical_rate * MS_TO_FT_MIN
+            anomalies.append(_anomaly(icao24, 'rapid_climb', 'HIGH', {
+                'vertical_rate_ft_min': round(vertical_rate_ft_min, 0),
+                'threshold_ft_min': self.rapid_climb_rate_ft_min,
+                'altitude_ft': round(current_altitude * M_TO_FT, 0) if current_altitude else None
+            }))
         
+        # Check for rapid descent (compare with recent history)
+        if current_altitude is not None and len(history) > 0:
+            # Find state from rapid_descent_window_seconds ago
+            cutoff_time = _state_time(current_state) - self.rapid_descent_window_seconds
+            
+            for past_state in _states_since(history, cutoff_time):
+                past_altitude = state_altitude(past_state)
+                if past_altitude is not None:
+                    altitude_drop_ft = (past_altitude - current_altitude) * M_TO_FT
+                    if altitude_drop_ft > self.rapid_descent_ft:
+                        anomalies.append(_anomaly(icao24, 'rapid_descent', 'CRITICAL', {
+                            'altitude_drop_ft': round(altitude_drop_ft, 0),
+                            'previous_altitude_ft': round(past_altitude * M_TO_FT, 0),
+                            'current_altitude_ft': round(current_altitude * M_TO_FT, 0),
+                            'time_window_seconds': self.rapid_descent_window_seconds
+                        }))
+                        break  # Only report once per descent
+    
+    def _check_squawk(self, anomalies: List[Dict], icao24: str, current_state: Dict,
+                      squawk) -> None:
+        """Append an emergency-squawk anomaly if the squawk is an emergency code."""
+        # OpenSky reports squawks as strings; only stringify other types
+        squawk_code = squawk if isinstance(squawk, str) else str(squawk)
+        squawk_type = self.emergency_squawks.get(squawk_code)
+        if squawk_type is not None:
+            anomalies.append(_anomaly(icao24, f'emergency_squawk_{squawk_type}', 'CRITICAL', {
+                'squawk_code': squawk_code,
+                'squawk_type': squawk_type,
+                'callsign': current_state.get('callsign')
+            }))
+    
+    def _check_pattern(self, anomalies: List[Dict], icao24: str, history: List[Dict]) -> None:
+        """Append erratic-heading and high-altitude hovering anomalies (history of 3+ states)."""
         # Check for erratic heading changes
-        heading_changes = []
-        for i in range(len(history) - 1):
-            prev_heading = history[i].get('heading')
-            curr_heading = history[i + 1].get('heading')
+        total_changes = 0
+        large_changes = 0
+        change_sum = 0.0
+        prev_heading = history[0].get('heading')
+        for i in range(1, len(history)):
+            curr_heading = history[i].get('heading')
             
             if prev_heading is not None and curr_heading is not None:
                 # Calculate heading change (handle wrap-around at 360/0)
                 change = abs(curr_heading - prev_heading)
-                if change > 180:
-                    change = 360 - change
-                heading_changes.append(change)
+                change = min(change, 360 - change)
+                total_changes += 1
+                large_changes += change > 90
+                change_sum += change
+            prev_heading = curr_heading
         
         # If we have multiple large heading changes, it's erratic
-        large_changes = [c for c in heading_changes if c > 90]
-        if len(large_changes) >= 3:
-            anomalies.append({
-                'icao24': icao24,
-                'type': 'erratic_heading',
-                'severity': 'MEDIUM',
-                'details': {
-                    'large_heading_changes': len(large_changes),
-                    'total_changes': len(heading_changes),
-                    'average_change': round(sum(heading_changes) / len(heading_changes), 1) if heading_changes else 0
-                }
-            })
+        if large_changes >= 3:
+            anomalies.append(_anomaly(icao24, 'erratic_heading', 'MEDIUM', {
+                'large_heading_changes': large_changes,
+                'total_changes': total_changes,
+                'average_change': round(change_sum / total_changes, 1)
+            }))
         
         # Check for hovering at unusual altitude (helicopter staying at high altitude)
         if len(history) >= 5:
-            altitudes = [h.get('baro_altitude') or h.get('geo_altitude') 
-                        for h in history[-5:] if h.get('baro_altitude') or h.get('geo_altitude')]
-            velocities = [h.get('velocity', 0) for h in history[-5:] if h.get('velocity')]
+            altitudes = []
+            velocities = []
+            for state in history[-5:]:
+                altitude = state_altitude(state)
+                velocity = state.get('velocity')
+                if altitude:
+                    altitudes.append(altitude)
+                if velocity:
+                    velocities.append(velocity)
             
             if len(altitudes) >= 3 and len(velocities) >= 3:
-                avg_altitude_ft = (sum(altitudes) / len(altitudes)) * 3.28084
-                avg_velocity_knots = (sum(velocities) / len(velocities)) * 1.94384
+                avg_altitude_m = sum(altitudes) / len(altitudes)
+                avg_velocity_ms = sum(velocities) / len(velocities)
                 
                 # Hovering = low speed at high altitude (>5000 ft)
-                if avg_altitude_ft > 5000 and avg_velocity_knots < 30:
-                    anomalies.append({
-                        'icao24': icao24,
-                        'type': 'hovering_high_altitude',
-                        'severity': 'LOW',
-                        'details': {
-                            'average_altitude_ft': round(avg_altitude_ft, 0),
-                            'average_velocity_knots': round(avg_velocity_knots, 1)
-                        }
-                    })
-        
-        return anomalies
+                if avg_altitude_m > HOVER_MIN_ALTITUDE_M and avg_velocity_ms < HOVER_MAX_VELOCITY_MS:
+                    anomalies.append(_anomaly(icao24, 'hovering_high_altitude', 'LOW', {
+                        'average_altitude_ft': round(avg_altitude_m * M_TO_FT, 0),
+                        'average_velocity_knots': round(avg_velocity_ms * MS_TO_KT, 1)
+                    }))
     
     def check_multiple_launch(self, current_states: Dict[str, Dict],
                               previous_states: Dict[str, Dict]) -> List[Dict]:
@@ -300,43 +379,35 @@ class AnomalyDetector:
         Returns:
             List of anomaly dictionaries
         """
-        anomalies = []
-        
         # Find aircraft that transitioned from on_ground=True to on_ground=False
         launches = []
+        launch_times = []
         for icao24, current_state in current_states.items():
-            current_on_ground = current_state.get('on_ground')
             previous_state = previous_states.get(icao24)
-            
-            if previous_state:
-                previous_on_ground = previous_state.get('on_ground')
-                
-                # Transition from ground to air
-                if previous_on_ground and not current_on_ground:
-                    launches.append({
-                        'icao24': icao24,
-                        'timestamp': current_state.get('last_contact') or current_state.get('timestamp', 0),
-                        'callsign': current_state.get('callsign')
-                    })
+            if previous_state and previous_state.get('on_ground') and not current_state.get('on_ground'):
+                launches.append({'icao24': icao24, 'callsign': current_state.get('callsign')})
+                launch_times.append(_state_time(current_state))
+        
+        anomalies = []
+        self._check_launches(anomalies, launches, launch_times)
+        return anomalies
+    
+    def _check_launches(self, anomalies: List[Dict], launches: List[Dict],
+                        launch_times: List[float]) -> None:
+        """
+        Append a multiple-launch anomaly if 3+ launches fall within the window.
         
+        launches holds the {'icao24', 'callsign'} entries reported in the
+        anomaly details; launch_times holds the matching launch timestamps.
+        """
         # If 3+ aircraft launched within the time window, it's a multi-launch
         if len(launches) >= 3:
-            # Check if launches are within the time window
-            if launches:
-                timestamps = [l['timestamp'] for l in launches]
-                time_span = max(timestamps) - min(timestamps)
-                
-                if time_span <= self.multi_launch_window_seconds:
-                    anomalies.append({
-                        'icao24': None,  # Multi-aircraft anomaly
-                        'type': 'multiple_launch',
-                        'severity': 'CRITICAL',
-                        'details': {
-                            'aircraft_count': len(launches),
-                            'time_span_seconds': time_span,
-                            'aircraft': [{'icao24': l['icao24'], 'callsign': l.get('callsign')} 
-                                        for l in launches]
-                        }
-                    })
-        
-        return anomalies
+            time_span = max(launch_times) - min(launch_times)
+            
+            if time_span <= self.multi_launch_window_seconds:
+                # Multi-aircraft anomaly (no single icao24)
+                anomalies.append(_anomaly(None, 'multiple_launch', 'CRITICAL', {
+                    'aircraft_count': len(launches),
+                    'time_span_seconds': time_span,
+                    'aircraft': launches
+                }))
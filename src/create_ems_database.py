@@ -7,13 +7,45 @@ in JSON, CSV, and SQLite formats for use with OpenSky API tracking.
 
 import json
 import csv
+import io
+import logging
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import List
 from datetime import datetime
 
 from filter_ems_aircraft import EMSAircraftFilter, EMSAircraft
 
+try:
+    import orjson
+except ImportError:
+    # Optional dependency - fall back to stdlib json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Exported columns, in output order (JSON keys, CSV header, SQLite columns)
+AIRCRAFT_FIELDS = (
+    'n_number', 'mode_s_hex', 'model_code', 'model_name', 'manufacturer',
+    'owner_name', 'owner_city', 'owner_state', 'match_reasons', 'confidence',
+    'type_aircraft', 'type_engine', 'status_code'
+)
+_get_aircraft_fields = attrgetter(*AIRCRAFT_FIELDS)
+_MATCH_REASONS_INDEX = AIRCRAFT_FIELDS.index('match_reasons')
+
+
+def write_json(data, file_path: Path) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 class EMSDatabaseGenerator:
     """Generate EMS aircraft databases in multiple formats."""
@@ -26,21 +58,7 @@ class EMSDatabaseGenerator:
         
     def to_dict(self, aircraft: EMSAircraft) -> dict:
         """Convert EMSAircraft to dictionary."""
-        return {
-            'n_number': aircraft.n_number,
-            'mode_s_hex': aircraft.mode_s_hex,
-            'model_code': aircraft.model_code,
-            'model_name': aircraft.model_name,
-            'manufacturer': aircraft.manufacturer,
-            'owner_name': aircraft.owner_name,
-            'owner_city': aircraft.owner_city,
-            'owner_state': aircraft.owner_state,
-            'match_reasons': aircraft.match_reasons,
-            'confidence': aircraft.confidence,
-            'type_aircraft': aircraft.type_aircraft,
-            'type_engine': aircraft.type_engine,
-            'status_code': aircraft.status_code
-        }
+        return dict(zip(AIRCRAFT_FIELDS, _get_aircraft_fields(aircraft)))
     
     def save_json(self, aircraft_list: List[EMSAircraft]) -> None:
         """Save aircraft data to JSON file."""
@@ -55,10 +73,9 @@ class EMSDatabaseGenerator:
             'aircraft': [self.to_dict(ac) for ac in aircraft_list]
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, output_file)
         
-        print(f"Saved JSON database: {output_file} ({len(aircraft_list)} aircraft)")
+        logger.info("Saved JSON database: %s (%d aircraft)", output_file, len(aircraft_list))
     
     def save_json_to_path(self, aircraft_list: List[EMSAircraft], file_path: Path) -> None:
         """Save aircraft data to a specific JSON file path (for custom database builds)."""
@@ -72,35 +89,34 @@ class EMSDatabaseGenerator:
             },
             'aircraft': [self.to_dict(ac) for ac in aircraft_list]
         }
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"Saved JSON database: {file_path} ({len(aircraft_list)} aircraft)")
+        write_json(data, file_path)
+        logger.info("Saved JSON database: %s (%d aircraft)", file_path, len(aircraft_list))
     
     def save_csv(self, aircraft_list: List[EMSAircraft]) -> None:
         """Save aircraft data to CSV file."""
         output_file = self.output_dir / "ems_aircraft.csv"
         
         if not aircraft_list:
-            print("No aircraft to save to CSV")
+            logger.info("No aircraft to save to CSV")
             return
         
-        fieldnames = [
-            'n_number', 'mode_s_hex', 'model_code', 'model_name', 'manufacturer',
-            'owner_name', 'owner_city', 'owner_state', 'match_reasons', 'confidence',
-            'type_aircraft', 'type_engine', 'status_code'
-        ]
+        rows = []
+        for aircraft in aircraft_list:
+            row = list(_get_aircraft_fields(aircraft))
+            # Use the joined match_reasons string for CSV
+            row[_MATCH_REASONS_INDEX] = aircraft.match_reasons_str
+            rows.append(row)
+        
+        # Format the whole file in memory, then write it in one call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(AIRCRAFT_FIELDS)
+        writer.writerows(rows)
         
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for aircraft in aircraft_list:
-                row = self.to_dict(aircraft)
-                # Convert match_reasons list to string for CSV
-                row['match_reasons'] = '; '.join(row['match_reasons'])
-                writer.writerow(row)
-        
-        print(f"Saved CSV database: {output_file} ({len(aircraft_list)} aircraft)")
+            f.write(buffer.getvalue())
+        
+        logger.info("Saved CSV database: %s (%d aircraft)", output_file, len(aircraft_list))
     
     def save_sqlite(self, aircraft_list: List[EMSAircraft]) -> None:
         """Save aircraft data to SQLite database."""
@@ -111,6 +127,9 @@ class EMSDatabaseGenerator:
             output_file.unlink()
         
         conn = sqlite3.connect(output_file)
+        # One-shot build of a throwaway file: skip fsyncs and keep temp data in memory
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
         cursor = conn.cursor()
         
         # Create table
@@ -132,21 +151,9 @@ class EMSDatabaseGenerator:
             )
         """)
         
-        # Create indexes for common queries
-        cursor.execute("CREATE INDEX idx_mode_s_hex ON ems_aircraft(mode_s_hex)")
-        cursor.execute("CREATE INDEX idx_confidence ON ems_aircraft(confidence)")
-        cursor.execute("CREATE INDEX idx_model_name ON ems_aircraft(model_name)")
-        cursor.execute("CREATE INDEX idx_state ON ems_aircraft(owner_state)")
-        
-        # Insert data
-        for aircraft in aircraft_list:
-            cursor.execute("""
-                INSERT INTO ems_aircraft (
-                    n_number, mode_s_hex, model_code, model_name, manufacturer,
-                    owner_name, owner_city, owner_state, match_reasons, confidence,
-                    type_aircraft, type_engine, status_code
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        # Insert data in a single transaction
+        rows = [
+            (
                 aircraft.n_number,
                 aircraft.mode_s_hex,
                 aircraft.model_code,
@@ -155,31 +162,48 @@ class EMSDatabaseGenerator:
                 aircraft.owner_name,
                 aircraft.owner_city,
                 aircraft.owner_state,
-                '; '.join(aircraft.match_reasons),
+                aircraft.match_reasons_str,
                 aircraft.confidence,
                 aircraft.type_aircraft,
                 aircraft.type_engine,
                 aircraft.status_code
-            ))
+            )
+            for aircraft in aircraft_list
+        ]
+        cursor.executemany("""
+            INSERT INTO ems_aircraft (
+                n_number, mode_s_hex, model_code, model_name, manufacturer,
+                owner_name, owner_city, owner_state, match_reasons, confidence,
+                type_aircraft, type_engine, status_code
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
+        # Create indexes for common queries (after the bulk insert so they are built once)
+        cursor.execute("CREATE INDEX idx_mode_s_hex ON ems_aircraft(mode_s_hex)")
+        cursor.execute("CREATE INDEX idx_confidence ON ems_aircraft(confidence)")
+        cursor.execute("CREATE INDEX idx_model_name ON ems_aircraft(model_name)")
+        cursor.execute("CREATE INDEX idx_state ON ems_aircraft(owner_state)")
         
         conn.commit()
         conn.close()
         
-        print(f"Saved SQLite database: {output_file} ({len(aircraft_list)} aircraft)")
+        logger.info("Saved SQLite database: %s (%d aircraft)", output_file, len(aircraft_list))
     
     def generate(self, aircraft_list: List[EMSAircraft]) -> None:
         """Generate all database formats."""
-        print("\nGenerating EMS aircraft databases...")
+        logger.info("\nGenerating EMS aircraft databases...")
         
         if not aircraft_list:
-            print("No aircraft to save")
+            logger.info("No aircraft to save")
             return
         
-        self.save_json(aircraft_list)
-        self.save_csv(aircraft_list)
-        self.save_sqlite(aircraft_list)
+        # The writers target independent files and only read aircraft_list,
+        # so run them concurrently (list() re-raises any writer exception)
+        writers = (self.save_json, self.save_csv, self.save_sqlite)
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            list(executor.map(lambda save: save(aircraft_list), writers))
         
-        print("\nDatabase generation complete!")
+        logger.info("\nDatabase generation complete!")
 
 
 def main():
@@ -188,10 +212,19 @@ def main():
     project_root = Path(__file__).parent.parent
     output_dir = project_root / "data"
     
+    # Single stdout handler for progress output; honours LOG_LEVEL from config
+    sys.path.insert(0, str(project_root))
+    try:
+        import config
+        log_level = config.LOG_LEVEL
+    except (ImportError, AttributeError):
+        log_level = "INFO"
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=log_level.upper(), handlers=[handler])
+    
     # Run filter
-    print("=" * 60)
-    print("EMS Aircraft Database Generator")
-    print("=" * 60)
+    logger.info("\n".join(("=" * 60, "EMS Aircraft Database Generator", "=" * 60)))
     
     filter_obj = EMSAircraftFilter(project_root)
     ems_aircraft = filter_obj.run()
@@ -200,11 +233,13 @@ def main():
     generator = EMSDatabaseGenerator(project_root, output_dir)
     generator.generate(ems_aircraft)
     
-    print("\n" + "=" * 60)
-    print("Summary:")
-    print(f"  Total EMS aircraft identified: {len(ems_aircraft)}")
-    print(f"  Output directory: {output_dir}")
-    print("=" * 60)
+    logger.info("\n".join((
+        "\n" + "=" * 60,
+        "Summary:",
+        f"  Total EMS aircraft identified: {len(ems_aircraft)}",
+        f"  Output directory: {output_dir}",
+        "=" * 60
+    )))
 
 
 if __name__ == "__main__":
@@ -9,16 +9,94 @@ that are likely used for EMS/emergency medical services based on:
 """
 
 import csv
+import logging
 import re
 import os
+import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Model string normalization patterns (compiled once, used for every ACFTREF row)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\w+')
+
+# Business suffixes stripped (in this order) from the end of owner names
+_OWNER_SUFFIX_RES = [
+    re.compile(rf'{re.escape(suffix)}\s*$', re.IGNORECASE)
+    for suffix in (' LLC', ' INC', ' CORP', ' CORPORATION', ' LTD', ' LIMITED',
+                   ' LP', ' LLP', ' PC', ' PLLC', ' LLC.', ' INC.', ' CORP.')
+]
+
+# mediModels.txt parsing: parenthetical notes, and the lines where the model list ends
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_MODELS_END_PREFIXES = ('What to Exclude', 'Strongly')
+# The ASCII characters _PUNCT_RE strips, as a str.translate deletion table
+_PUNCT_TABLE = str.maketrans('', '', ''.join(_PUNCT_RE.findall(''.join(map(chr, range(128))))))
+
+
+# MASTER.txt columns read by filter_aircraft, in unpacking order (besides N-NUMBER,
+# which is located separately to tolerate a BOM or "N NUMBER" header)
+MASTER_COLUMNS = (
+    'MFR MDL CODE', 'NAME', 'STATUS CODE', 'TYPE AIRCRAFT', 'TYPE ENGINE',
+    'TYPE REGISTRANT', 'MODE S CODE HEX', 'CITY', 'STATE'
+)
+
+
+def _trie_pattern(keywords: Set[str]) -> str:
+    """
+    Build a regex for a keyword set with shared prefixes factored out, e.g.
+    {'BK117', 'BELL 407'} -> 'B(?:ELL 407|K117)'. The engine then walks one
+    prefix branch per position instead of trying every keyword in turn;
+    the longest keyword still wins at a given position.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-keyword marker
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A keyword ends here too: the longer continuations are optional
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+def _keyword_regex(keywords: Set[str], word_boundary_max_len: int = 0) -> re.Pattern:
+    """
+    Compile a keyword set into one prefix-factored alternation, so a single
+    search() scans the text once instead of one substring scan per keyword.
+    
+    Keywords of at most word_boundary_max_len characters only match as whole words.
+    """
+    if not keywords:
+        return re.compile(r'(?!)')  # matches nothing
+    alternatives = [rf'\b{re.escape(keyword)}\b'
+                    for keyword in sorted(keywords, key=len, reverse=True)
+                    if len(keyword) <= word_boundary_max_len]
+    substrings = {keyword for keyword in keywords if len(keyword) > word_boundary_max_len}
+    if substrings:
+        alternatives.append(_trie_pattern(substrings))
+    return re.compile('|'.join(alternatives))
+
+
+@dataclass(slots=True, frozen=True)
 class EMSAircraft:
-    """Represents a filtered EMS aircraft with metadata."""
+    """Represents a filtered EMS aircraft with metadata (immutable once built)."""
     n_number: str
     mode_s_hex: str
     model_code: str
@@ -27,19 +105,36 @@ class EMSAircraft:
     owner_name: str
     owner_city: str
     owner_state: str
-    match_reasons: List[str]
+    match_reasons: Tuple[str, ...]
     confidence: str  # 'high', 'medium', 'low'
     type_aircraft: str
     type_engine: str
     status_code: str
+    # '; '-joined match_reasons for the CSV/SQLite exports, built once
+    match_reasons_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        match_reasons = tuple(self.match_reasons)
+        object.__setattr__(self, 'match_reasons', match_reasons)
+        object.__setattr__(self, 'match_reasons_str', '; '.join(match_reasons))
 
 
 class EMSAircraftFilter:
     """Filters FAA aircraft database for EMS/emergency medical service aircraft."""
     
-    def __init__(self, data_dir: Path):
-        """Initialize filter with data directory paths."""
+    def __init__(self, data_dir: Path, verbose: bool = False):
+        """
+        Initialize filter with data directory paths.
+        
+        Args:
+            data_dir: Project directory containing ReleasableAircraft/ and mediModels.txt
+            verbose: Print debug samples (patterns, model codes, first rows, owners)
+                while filtering. Per-aircraft lines for EMS model codes are logged
+                at DEBUG level.
+        """
         self.data_dir = data_dir
+        self.verbose = verbose
         self.master_file = data_dir / "ReleasableAircraft" / "MASTER.txt"
         self.acftref_file = data_dir / "ReleasableAircraft" / "ACFTREF.txt"
         self.models_file = data_dir / "mediModels.txt"
@@ -47,8 +142,13 @@ class EMSAircraftFilter:
         # Model code to model info mapping
         self.model_lookup: Dict[str, Dict[str, str]] = {}
         
-        # EMS model patterns (normalized)
+        # EMS model patterns (normalized), and their single-pass matcher
         self.ems_model_patterns: Set[str] = set()
+        self._ems_pattern_re = _keyword_regex(self.ems_model_patterns)
+        
+        # ACFTREF model codes whose model matches an EMS pattern (built with the lookup)
+        self.ems_model_codes: Set[str] = set()
+        self._ems_model_samples: List[Tuple[str, str, str]] = []
         
         # EMS/Fire/Rescue owner name keywords
         self.ems_keywords: Set[str] = {
@@ -98,14 +198,39 @@ class EMSAircraftFilter:
         self.business_jet_patterns = {'CITATION', 'LEARJET', 'GULFSTREAM', 'FALCON', 
                                       'CHALLENGER', 'GLOBAL', 'LEGACY', 'PHENOM'}
         
-    def normalize_model_string(self, model: str) -> str:
-        """Normalize model string for matching: uppercase, strip punctuation."""
+        # Single-pass matchers for the keyword sets checked on every MASTER row.
+        # Short owner keywords (FD, EMS, PD, SO, ...) must match whole words, which
+        # is a set test against the owner name's words; longer ones are substrings.
+        self._owner_word_keywords = frozenset(
+            keyword for keyword in self.ems_keywords
+            if len(keyword) <= 3 and _WORD_RE.fullmatch(keyword)
+        )
+        self._owner_keyword_re = _keyword_regex(self.ems_keywords - self._owner_word_keywords,
+                                                word_boundary_max_len=3)
+        self._ems_keyword_re = _keyword_regex(self.ems_keywords)
+        self._museum_re = _keyword_regex(self.museum_keywords)
+        self._commercial_re = _keyword_regex(self.commercial_exclusion_keywords)
+        self._airline_re = _keyword_regex(self.airline_patterns)
+        
+        # ACFTREF model codes excluded as airline aircraft (built with the lookup)
+        self._airline_excluded_codes: Set[str] = set()
+        
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def normalize_model_string(model: str) -> str:
+        """
+        Normalize model string for matching: uppercase, strip punctuation.
+        
+        Cached: ACFTREF repeats the same model strings across many codes.
+        """
         if not model:
             return ""
-        # Remove punctuation and extra spaces
-        normalized = re.sub(r'[^\w\s]', '', model.upper())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        model = model.upper()
+        # Remove punctuation and extra spaces (translate/split for the usual ASCII
+        # strings; the regexes handle Unicode word and whitespace characters)
+        if model.isascii():
+            return ' '.join(model.translate(_PUNCT_TABLE).split())
+        return _WS_RE.sub(' ', _PUNCT_RE.sub('', model)).strip()
     
     def load_ems_models(self) -> None:
         """Load EMS model patterns from mediModels.txt."""
@@ -116,13 +241,19 @@ class EMSAircraftFilter:
         with open(self.models_file, 'r', encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
-                if not line or line.startswith('[') or line.startswith('**'):
-                    if line.startswith('['):
-                        current_section = line
+                if not line:
+                    continue
+                
+                # Section markers and notes
+                first = line[0]
+                if first == '[':
+                    current_section = line
+                    continue
+                if first == '*' and line.startswith('**'):
                     continue
                 
                 # Skip exclusion notes and other metadata
-                if line.startswith('What to Exclude') or line.startswith('Strongly'):
+                if line.startswith(_MODELS_END_PREFIXES):
                     break
                 
                 # Skip section headers
@@ -131,7 +262,7 @@ class EMSAircraftFilter:
                 
                 # Extract model names
                 # Remove parenthetical notes like "(JetRanger / LongRanger)"
-                model = re.sub(r'\([^)]*\)', '', line).strip()
+                model = _PAREN_RE.sub('', line).strip()
                 
                 if model and current_section != '[Common substrings:]':
                     normalized = self.normalize_model_string(model)
@@ -140,9 +271,11 @@ class EMSAircraftFilter:
         
         # Add FAA model codes for King Air
         self.ems_model_patterns.update(['BE90', 'BE20', 'BE30'])
+        self._ems_pattern_re = _keyword_regex(self.ems_model_patterns)
         
         print(f"Loaded {len(self.ems_model_patterns)} EMS model patterns")
-        print(f"Sample patterns: {list(self.ems_model_patterns)[:10]}")
+        if self.verbose:
+            print(f"Sample patterns: {list(islice(self.ems_model_patterns, 10))}")
     
     def load_aircraft_reference(self) -> None:
         """Load aircraft reference database (ACFTREF.txt) to map codes to models."""
@@ -150,85 +283,93 @@ class EMSAircraftFilter:
             raise FileNotFoundError(f"ACFTREF file not found: {self.acftref_file}")
         
         with open(self.acftref_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader rows indexed by column position (no per-row dict)
+            reader = csv.reader(f)
             
             # Get fieldnames - handle trailing comma by filtering out None/empty
-            if not reader.fieldnames:
+            fieldnames = next(reader, None)
+            if not fieldnames:
                 raise ValueError("Could not read header from ACFTREF file")
             
-            # Find the actual column keys (handle trailing comma that creates empty key)
+            # Find the actual column positions (handle trailing comma that creates empty key)
             # Also handle BOM (Byte Order Mark) in CSV files
-            code_key = None
-            mfr_key = None
-            model_key = None
+            code_idx = None
+            mfr_idx = None
+            model_idx = None
             
-            for key in reader.fieldnames:
+            for i, key in enumerate(fieldnames):
                 if key:
                     key_clean = key.strip().lstrip('\ufeff')  # Remove BOM and whitespace
                     if key_clean == 'CODE':
-                        code_key = key
+                        code_idx = i
                     elif key_clean == 'MFR':
-                        mfr_key = key
+                        mfr_idx = i
                     elif key_clean == 'MODEL':
-                        model_key = key
+                        model_idx = i
             
             # Fallback: use first few columns if standard names not found
-            if not code_key:
+            if code_idx is None:
                 # Try to use first non-empty column
-                valid_keys = [k for k in reader.fieldnames if k and k.strip()]
-                if len(valid_keys) >= 3:
-                    code_key = valid_keys[0]
-                    mfr_key = valid_keys[1] if not mfr_key else mfr_key
-                    model_key = valid_keys[2] if not model_key else model_key
-                    print(f"Warning: Using positional columns. Found: {valid_keys[:3]}")
+                valid_idx = [i for i, k in enumerate(fieldnames) if k and k.strip()]
+                if len(valid_idx) >= 3:
+                    code_idx = valid_idx[0]
+                    mfr_idx = valid_idx[1] if mfr_idx is None else mfr_idx
+                    model_idx = valid_idx[2] if model_idx is None else model_idx
+                    print(f"Warning: Using positional columns. Found: {[fieldnames[i] for i in valid_idx[:3]]}")
                 else:
-                    raise ValueError(f"Could not find CODE column. Available: {reader.fieldnames[:5]}")
+                    raise ValueError(f"Could not find CODE column. Available: {fieldnames[:5]}")
             
+            # EMS model patterns must already be loaded (run() calls load_ems_models first)
+            search_patterns = self._ems_pattern_re.search
             for row in reader:
-                # Use .get() to safely access columns (handles missing keys)
-                code = row.get(code_key, '').strip() if code_key else ''
+                if not row:
+                    continue  # Blank line
+                
+                code = row[code_idx].strip()
                 if not code:
                     continue
+                code = sys.intern(code)  # Same object as the interned MASTER model codes
                 
-                mfr = row.get(mfr_key, '').strip() if mfr_key else ''
-                model = row.get(model_key, '').strip() if model_key else ''
+                mfr = row[mfr_idx].strip() if mfr_idx is not None else ''
+                model = row[model_idx].strip() if model_idx is not None else ''
                 
+                model_normalized = self.normalize_model_string(model)
                 self.model_lookup[code] = {
                     'manufacturer': mfr,
                     'model': model,
-                    'model_normalized': self.normalize_model_string(model)
+                    'model_normalized': model_normalized
                 }
+                
+                # Check if the normalized or raw model contains any EMS pattern
+                # (substring matching also covers prefix matches)
+                match = search_patterns(model_normalized) or search_patterns(model.upper())
+                if match:
+                    self.ems_model_codes.add(code)
+                    if len(self._ems_model_samples) < 10:
+                        self._ems_model_samples.append((code, model, match.group()))
+                else:
+                    self.ems_model_codes.discard(code)
+                
+                # The airline exclusion only depends on the model, so decide it once per code
+                if self._airline_re.search(model_normalized):
+                    self._airline_excluded_codes.add(code)
+                else:
+                    self._airline_excluded_codes.discard(code)
         
         print(f"Loaded {len(self.model_lookup)} aircraft model references")
     
     def matches_ems_model(self, model_code: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Check if model code matches any EMS model pattern.
+        
+        ems_model_codes (built by load_aircraft_reference from every ACFTREF entry) holds
+        each code whose model matches a pattern, so this is a set lookup.
         Returns: (matches, model_name, manufacturer)
         """
-        if not model_code:
-            return False, None, None
-        
-        # First check if this is a known EMS model code
-        if hasattr(self, 'ems_model_codes') and model_code in self.ems_model_codes:
+        if model_code in self.ems_model_codes:
             model_info = self.model_lookup[model_code]
             return True, model_info['model'], model_info['manufacturer']
         
-        # Fallback: check if model code exists and matches patterns
-        if model_code not in self.model_lookup:
-            return False, None, None
-        
-        model_info = self.model_lookup[model_code]
-        model_normalized = model_info['model_normalized']
-        model_name = model_info['model']
-        manufacturer = model_info['manufacturer']
-        
-        # Check if normalized model matches any EMS pattern
-        for pattern in self.ems_model_patterns:
-            # Use prefix matching for flexibility
-            if model_normalized.startswith(pattern) or pattern in model_normalized:
-                return True, model_name, manufacturer
-        
         return False, None, None
     
     def normalize_owner_name(self, owner_name: str) -> str:
@@ -240,20 +381,18 @@ class EMSAircraftFilter:
             return ""
         
         # Convert to uppercase
-        normalized = owner_name.upper()
-        
-        # Remove common business suffixes (but keep the name for matching)
-        # Use word boundaries to avoid removing keywords that contain these
-        suffixes = [' LLC', ' INC', ' CORP', ' CORPORATION', ' LTD', ' LIMITED',
-                   ' LP', ' LLP', ' PC', ' PLLC', ' LLC.', ' INC.', ' CORP.']
-        for suffix in suffixes:
-            # Remove suffix only if it's at the end (with optional punctuation)
-            normalized = re.sub(rf'{re.escape(suffix)}\s*$', '', normalized, flags=re.IGNORECASE)
+        return self._normalize_owner_upper(owner_name.upper())
+    
+    @staticmethod
+    def _normalize_owner_upper(normalized: str) -> str:
+        """normalize_owner_name() for an owner name that is already uppercase."""
+        # Remove common business suffixes (but keep the name for matching),
+        # in order, and only at the end of the name
+        for suffix_re in _OWNER_SUFFIX_RES:
+            normalized = suffix_re.sub('', normalized)
         
         # Normalize whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
+        return _WS_RE.sub(' ', normalized).strip()
     
     def matches_owner_keywords(self, owner_name: str) -> bool:
         """
@@ -262,86 +401,74 @@ class EMSAircraftFilter:
         """
         if not owner_name:
             return False
+        return self._matches_owner_keywords_upper(owner_name.upper())
+    
+    def _matches_owner_keywords_upper(self, owner_upper: str) -> bool:
+        """matches_owner_keywords() for an owner name that is already uppercase."""
+        if not owner_upper:
+            return False
         
         # Normalize owner name (remove LLC/INC/CORP suffixes)
-        owner_normalized = self.normalize_owner_name(owner_name)
-        
-        # Check for keywords in normalized name
-        for keyword in self.ems_keywords:
-            # Use word boundary matching for short keywords to avoid false positives
-            if len(keyword) <= 3:
-                # For short keywords (FD, EMS, PD, SO), require word boundaries
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, owner_normalized):
-                    return True
-            else:
-                # For longer keywords, substring matching is fine
-                if keyword in owner_normalized:
-                    return True
-        return False
+        owner_normalized = self._normalize_owner_upper(owner_upper)
+        
+        # Check for keywords in normalized name (substring scan for longer keywords,
+        # whole-word set test for short ones)
+        return (self._owner_keyword_re.search(owner_normalized) is not None
+                or not self._owner_word_keywords.isdisjoint(_WORD_RE.findall(owner_normalized)))
     
-    def should_exclude(self, row: Dict[str, str]) -> Tuple[bool, str]:
+    def should_exclude(self, status_code: str, owner_name: str, type_aircraft: str,
+                       type_engine: str, model_code: str, type_registrant: str,
+                       owner_upper: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check if aircraft should be excluded.
+        Takes the stripped MASTER fields (STATUS CODE, NAME, TYPE AIRCRAFT,
+        TYPE ENGINE, MFR MDL CODE, TYPE REGISTRANT), plus owner_name.upper()
+        if the caller already has it.
         Returns: (should_exclude, reason)
         """
         # Exclude inactive registrations
-        status_code = row.get('STATUS CODE', '').strip()
         if status_code != 'V':
             return True, f"Status code: {status_code}"
         
         # Exclude museum-owned aircraft (static displays, not operational)
-        owner_name = row.get('NAME', '').strip().upper()
-        if owner_name:
-            for museum_keyword in self.museum_keywords:
-                if museum_keyword in owner_name:
-                    return True, f"Museum-owned: {row.get('NAME', '').strip()[:50]}"
+        if owner_upper is None:
+            owner_upper = owner_name.upper()
+        if owner_upper:
+            if self._museum_re.search(owner_upper):
+                return True, f"Museum-owned: {owner_name[:50]}"
             
             # Exclude commercial cargo/logistics companies (FedEx, etc.)
-            for exclusion_keyword in self.commercial_exclusion_keywords:
-                if exclusion_keyword in owner_name:
-                    return True, f"Commercial cargo: {row.get('NAME', '').strip()[:50]}"
+            if self._commercial_re.search(owner_upper):
+                return True, f"Commercial cargo: {owner_name[:50]}"
         
         # Exclude piston aircraft (TYPE AIRCRAFT = 4, TYPE ENGINE = 1)
-        type_aircraft = row.get('TYPE AIRCRAFT', '').strip()
-        type_engine = row.get('TYPE ENGINE', '').strip()
-        
         if type_aircraft == '4' and type_engine == '1':
             return True, "Piston engine aircraft"
         
-        # Exclude airline aircraft by model
-        model_code = row.get('MFR MDL CODE', '').strip()
-        if model_code in self.model_lookup:
-            model_name = self.model_lookup[model_code]['model']
-            model_normalized = self.normalize_model_string(model_name)
-            
-            for airline_pattern in self.airline_patterns:
-                if airline_pattern in model_normalized:
-                    return True, f"Airline aircraft: {model_name}"
-            
-            # Check for business jets that aren't EMS (but only exclude if no EMS indicators)
-            # We'll check this later after determining if it's an EMS aircraft
-            # This prevents excluding legitimate EMS aircraft that happen to be jets
+        # Exclude airline aircraft by model (precomputed per code in load_aircraft_reference)
+        # Business jets that aren't EMS are not excluded here: that is decided after
+        # determining if it's an EMS aircraft, so legitimate EMS jets are kept
+        if model_code in self._airline_excluded_codes:
+            return True, f"Airline aircraft: {self.model_lookup[model_code]['model']}"
         
         # Exclude individual owners (TYPE REGISTRANT = 1)
-        type_registrant = row.get('TYPE REGISTRANT', '').strip()
         if type_registrant == '1':
             return True, "Individual owner"
         
         # Exclude private LLCs that don't contain emergency/police keywords
         # This excludes generic private ownership but keeps legitimate emergency service LLCs
-        if owner_name:
+        if owner_upper:
             # Check if it's an LLC
-            is_llc = any(llc_indicator in owner_name for llc_indicator in 
+            is_llc = any(llc_indicator in owner_upper for llc_indicator in 
                         [' LLC', ' LLC.', ' LIMITED LIABILITY', ' L.L.C.', ' L L C'])
             
             if is_llc:
                 # Check if it contains any emergency/police keywords
                 # If it's an LLC but has emergency keywords, keep it (e.g., "ABC Fire Department LLC")
-                has_emergency_keyword = any(keyword in owner_name for keyword in self.ems_keywords)
+                has_emergency_keyword = self._ems_keyword_re.search(owner_upper) is not None
                 
                 if not has_emergency_keyword:
-                    return True, f"Private LLC (no emergency keywords): {row.get('NAME', '').strip()[:50]}"
+                    return True, f"Private LLC (no emergency keywords): {owner_name[:50]}"
         
         return False, ""
     
@@ -352,7 +479,7 @@ class EMSAircraftFilter:
         
         ems_aircraft = []
         excluded_count = 0
-        excluded_reasons = {}
+        excluded_reasons: Counter = Counter()
         model_match_count = 0
         owner_match_count = 0
         n_pattern_match_count = 0
@@ -365,70 +492,94 @@ class EMSAircraftFilter:
         sample_owners = []
         first_few_rows = []
         
+        verbose = self.verbose
+        # Per-aircraft EMS code trace; level checked once so the loop skips it otherwise
+        trace_ems = logger.isEnabledFor(logging.DEBUG)
+        
         print("Filtering aircraft database...")
         with open(self.master_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader rows indexed by column position (no per-row dict)
+            reader = csv.reader(f)
+            fieldnames = next(reader, None) or []
             
             # Debug: Check what columns we actually have
-            if reader.fieldnames:
-                print(f"  CSV columns found: {list(reader.fieldnames)[:10]}")
+            n_number_idx = 0
+            if fieldnames:
+                print(f"  CSV columns found: {fieldnames[:10]}")
                 # Find N-NUMBER column (handle BOM and variations)
                 n_number_key = None
-                for key in reader.fieldnames:
+                for i, key in enumerate(fieldnames):
                     if key:
                         key_clean = key.strip().lstrip('\ufeff')
                         if key_clean == 'N-NUMBER' or key_clean == 'N NUMBER':
-                            n_number_key = key
+                            n_number_idx, n_number_key = i, key
                             break
                 if not n_number_key:
                     # Try first column
-                    n_number_key = reader.fieldnames[0] if reader.fieldnames else 'N-NUMBER'
-                    print(f"  Warning: Using first column as N-NUMBER: {n_number_key}")
+                    print(f"  Warning: Using first column as N-NUMBER: {fieldnames[0]}")
                 else:
                     print(f"  Using N-NUMBER column: '{n_number_key}'")
             
-            for idx, row in enumerate(reader):
-                # Collect first few rows for debugging (before any processing)
-                if idx < 5:
-                    # Try multiple ways to get N-number
-                    n_num = row.get('N-NUMBER', '') or row.get(n_number_key, '') if 'n_number_key' in locals() else row.get('N-NUMBER', '')
-                    first_few_rows.append({
-                        'n_number': n_num.strip() if n_num else '',
-                        'model_code': row.get('MFR MDL CODE', '').strip(),
-                        'owner': row.get('NAME', '').strip()[:30],
-                        'status': row.get('STATUS CODE', '').strip(),
-                        'type_acft': row.get('TYPE AIRCRAFT', '').strip(),
-                        'type_eng': row.get('TYPE ENGINE', '').strip()
-                    })
-                
-                # Extract data early for sample collection - handle N-number column variations
-                n_number = (row.get('N-NUMBER', '') or 
-                           (row.get(n_number_key, '') if 'n_number_key' in locals() else '')).strip()
-                model_code = row.get('MFR MDL CODE', '').strip()
-                owner_name = row.get('NAME', '').strip()
+            # Resolve the remaining column positions once
+            columns = {key: i for i, key in enumerate(fieldnames)}
+            missing = [key for key in MASTER_COLUMNS if key not in columns]
+            if missing:
+                raise ValueError(f"MASTER file is missing columns: {missing}")
+            
+            # Project each row onto just the columns used (the csv-module counterpart
+            # of a usecols= read) and strip every field once, in C
+            get_fields = itemgetter(n_number_idx, *(columns[key] for key in MASTER_COLUMNS))
+            intern = sys.intern
+            
+            # filter(None, ...) skips blank lines, as DictReader did
+            for idx, row in enumerate(filter(None, reader)):
+                (n_number, model_code, owner_name, status_code, type_aircraft, type_engine,
+                 type_registrant, mode_s_hex, owner_city, owner_state) = map(str.strip, get_fields(row))
+                # Short code fields repeat across rows; share one string per value
+                model_code = intern(model_code)
+                status_code = intern(status_code)
+                type_aircraft = intern(type_aircraft)
+                type_engine = intern(type_engine)
                 
-                # Collect samples for debugging - collect from ALL rows to see what we have
-                if len(sample_models) < 200 and model_code:
-                    in_lookup = model_code in self.model_lookup
-                    is_ems_code = hasattr(self, 'ems_model_codes') and model_code in self.ems_model_codes
-                    sample_models.append((model_code, in_lookup, is_ems_code, n_number))
-                    # If we find an EMS code, print it immediately for debugging with full row info
-                    if is_ems_code:
-                        status = row.get('STATUS CODE', '').strip()
-                        type_acft = row.get('TYPE AIRCRAFT', '').strip()
-                        type_eng = row.get('TYPE ENGINE', '').strip()
-                        print(f"  *** FOUND EMS CODE: {model_code} (N:{n_number or 'EMPTY'}) Status:{status} Type:{type_acft}/{type_eng} Owner:{owner_name[:40]} ***")
-                if len(sample_owners) < 200 and owner_name:
-                    sample_owners.append(owner_name[:50])
+                # Debug sample collection (verbose runs only; skipped with one check otherwise)
+                if verbose:
+                    # Collect first few rows for debugging (before any processing)
+                    if idx < 5:
+                        first_few_rows.append({
+                            'n_number': n_number,
+                            'model_code': model_code,
+                            'owner': owner_name[:30],
+                            'status': status_code,
+                            'type_acft': type_aircraft,
+                            'type_eng': type_engine
+                        })
+                    
+                    # Collect samples for debugging - collect from ALL rows to see what we have
+                    if len(sample_models) < 200 and model_code:
+                        in_lookup = model_code in self.model_lookup
+                        is_ems_code = model_code in self.ems_model_codes
+                        sample_models.append((model_code, in_lookup, is_ems_code, n_number))
+                        # If we find an EMS code, print it immediately for debugging with full row info
+                        if is_ems_code:
+                            logger.debug("  *** FOUND EMS CODE: %s (N:%s) Status:%s Type:%s/%s Owner:%s ***",
+                                         model_code, n_number or 'EMPTY', status_code,
+                                         type_aircraft, type_engine, owner_name[:40])
+                    if len(sample_owners) < 200 and owner_name:
+                        sample_owners.append(owner_name[:50])
                 
                 if idx > 0 and idx % 10000 == 0:
                     print(f"  Processed {idx} aircraft... (Found {len(ems_aircraft)} EMS, Excluded {excluded_count})")
                 
+                # Uppercase the owner name once for the exclusion and keyword checks
+                owner_upper = owner_name.upper()
+                
                 # Check exclusions
-                should_exclude, exclude_reason = self.should_exclude(row)
+                should_exclude, exclude_reason = self.should_exclude(
+                    status_code, owner_name, type_aircraft, type_engine, model_code,
+                    type_registrant, owner_upper)
                 if should_exclude:
                     excluded_count += 1
-                    excluded_reasons[exclude_reason] = excluded_reasons.get(exclude_reason, 0) + 1
+                    excluded_reasons[exclude_reason] += 1
                     # Track museum exclusions separately
                     if 'Museum' in exclude_reason:
                         museum_excluded_count += 1
@@ -442,23 +593,22 @@ class EMSAircraftFilter:
                     if 'Private LLC' in exclude_reason:
                         private_llc_excluded_count += 1
                     # Debug: If this is an EMS code that got excluded, note it
-                    if hasattr(self, 'ems_model_codes') and model_code in self.ems_model_codes:
-                        print(f"  *** EMS CODE EXCLUDED: {model_code} (N:{n_number or 'EMPTY'}) Reason: {exclude_reason} ***")
+                    if trace_ems and model_code in self.ems_model_codes:
+                        logger.debug("  *** EMS CODE EXCLUDED: %s (N:%s) Reason: %s ***",
+                                     model_code, n_number or 'EMPTY', exclude_reason)
                     continue
                 
                 # Skip if no N-number
                 if not n_number:
                     # Debug: If this is an EMS code with no N-number, note it
-                    if hasattr(self, 'ems_model_codes') and model_code in self.ems_model_codes:
-                        print(f"  *** EMS CODE SKIPPED (no N-number): {model_code} -> {self.model_lookup.get(model_code, {}).get('model', 'N/A')} ***")
+                    if trace_ems and model_code in self.ems_model_codes:
+                        logger.debug("  *** EMS CODE SKIPPED (no N-number): %s -> %s ***",
+                                     model_code, self.model_lookup.get(model_code, {}).get('model', 'N/A'))
                     continue
                 
-                mode_s_hex = row.get('MODE S CODE HEX', '').strip()
-                status_code = row.get('STATUS CODE', '').strip()
-                
                 # Validate Mode S code format (must be exactly 6 hex characters)
                 if mode_s_hex:
-                    mode_s_hex_upper = mode_s_hex.upper().strip()
+                    mode_s_hex_upper = mode_s_hex.upper()
                     # Validate: exactly 6 hex characters
                     if not re.match(r'^[0-9A-F]{6}$', mode_s_hex_upper):
                         # Invalid format - skip this aircraft
@@ -475,16 +625,18 @@ class EMSAircraftFilter:
                 
                 # If model code exists in lookup but wasn't matched as EMS model,
                 # still get the model name and manufacturer for database
-                if not model_name and model_code and model_code in self.model_lookup:
-                    model_info = self.model_lookup[model_code]
-                    model_name = model_info.get('model', '')
-                    manufacturer = model_info.get('manufacturer', '')
+                if not model_name:
+                    model_info = self.model_lookup.get(model_code)
+                    if model_info:
+                        model_name = model_info.get('model', '')
+                        manufacturer = model_info.get('manufacturer', '')
                 
-                owner_match = self.matches_owner_keywords(owner_name)
+                owner_match = self._matches_owner_keywords_upper(owner_upper)
                 
-                # Debug: If we have an EMS code and it matches, print it
-                if model_match and hasattr(self, 'ems_model_codes') and model_code in self.ems_model_codes:
-                    print(f"  *** EMS CODE MATCHED: {model_code} (N:{n_number}) Model:{model_name} Owner:{owner_name[:40]} ***")
+                # Debug: If we have an EMS code and it matches, log it
+                if trace_ems and model_match:
+                    logger.debug("  *** EMS CODE MATCHED: %s (N:%s) Model:%s Owner:%s ***",
+                                 model_code, n_number, model_name, owner_name[:40])
                 
                 if model_match:
                     model_match_count += 1
@@ -561,12 +713,12 @@ class EMSAircraftFilter:
                         model_name=model_name or "Unknown",
                         manufacturer=manufacturer or "Unknown",
                         owner_name=owner_name,
-                        owner_city=row.get('CITY', '').strip(),
-                        owner_state=row.get('STATE', '').strip(),
+                        owner_city=owner_city,
+                        owner_state=owner_state,
                         match_reasons=match_reasons,
                         confidence=confidence,
-                        type_aircraft=row.get('TYPE AIRCRAFT', '').strip(),
-                        type_engine=row.get('TYPE ENGINE', '').strip(),
+                        type_aircraft=type_aircraft,
+                        type_engine=type_engine,
                         status_code=status_code
                     )
                     
@@ -593,7 +745,7 @@ class EMSAircraftFilter:
         
         if excluded_reasons:
             print(f"\nExclusion reasons:")
-            for reason, count in sorted(excluded_reasons.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for reason, count in excluded_reasons.most_common(5):
                 print(f"  {reason}: {count}")
         
         if sample_models:
@@ -629,51 +781,30 @@ class EMSAircraftFilter:
         print("Loading aircraft reference database...")
         self.load_aircraft_reference()
         
-        # Build set of EMS model codes by checking ALL entries in lookup
-        ems_in_lookup = 0
-        sample_ems_models = []
-        ems_model_codes = set()  # Track which codes are EMS models
-        
-        print("Scanning all model references for EMS patterns...")
-        for code, info in self.model_lookup.items():
-            model_norm = info.get('model_normalized', '')
-            model_name = info.get('model', '')
-            
-            # Check if normalized model matches any EMS pattern
-            for pattern in self.ems_model_patterns:
-                # Use both prefix and substring matching
-                if (model_norm.startswith(pattern) or 
-                    pattern in model_norm or
-                    model_name.upper().startswith(pattern) or
-                    pattern in model_name.upper()):
-                    ems_in_lookup += 1
-                    ems_model_codes.add(code)
-                    if len(sample_ems_models) < 10:
-                        sample_ems_models.append((code, model_name, pattern))
-                    break
-        
-        self.ems_model_codes = ems_model_codes  # Store for use in filtering
-        print(f"Found {ems_in_lookup} potential EMS models in reference database")
+        # EMS model codes were collected while loading the reference database
+        ems_model_codes = self.ems_model_codes
+        print(f"Found {len(ems_model_codes)} potential EMS models in reference database")
         print(f"Total unique EMS model codes: {len(ems_model_codes)}")
-        if sample_ems_models:
+        if self._ems_model_samples:
             print("Sample EMS models in lookup:")
-            for code, model, pattern in sample_ems_models[:10]:
+            for code, model, pattern in self._ems_model_samples:
                 print(f"  Code {code}: {model} (matched pattern: {pattern})")
         
         # Debug: Check a few sample codes from ems_model_codes to see what they look like
-        print(f"\nSample EMS model codes (first 10): {list(ems_model_codes)[:10]}")
+        if self.verbose:
+            print(f"\nSample EMS model codes (first 10): {list(islice(ems_model_codes, 10))}")
         
         print("Filtering aircraft...")
         ems_aircraft = self.filter_aircraft()
         
         # Print summary statistics
-        confidence_counts = {}
+        confidence_counts: Counter = Counter()
         match_type_counts = {'model_only': 0, 'owner_only': 0, 'pattern_only': 0,
                             'model_owner': 0, 'model_pattern': 0, 'owner_pattern': 0,
                             'all_three': 0}
         
         for aircraft in ems_aircraft:
-            confidence_counts[aircraft.confidence] = confidence_counts.get(aircraft.confidence, 0) + 1
+            confidence_counts[aircraft.confidence] += 1
             
             # Track match type combinations
             has_model = any('Model:' in reason for reason in aircraft.match_reasons)
@@ -698,9 +829,9 @@ class EMSAircraftFilter:
         print("\nFiltering Summary:")
         print(f"  Total EMS aircraft found: {len(ems_aircraft)}")
         print(f"\n  Confidence Distribution:")
-        print(f"    High confidence: {confidence_counts.get('high', 0)}")
-        print(f"    Medium confidence: {confidence_counts.get('medium', 0)}")
-        print(f"    Low confidence: {confidence_counts.get('low', 0)}")
+        print(f"    High confidence: {confidence_counts['high']}")
+        print(f"    Medium confidence: {confidence_counts['medium']}")
+        print(f"    Low confidence: {confidence_counts['low']}")
         print(f"\n  Match Type Distribution:")
         print(f"    Model + Owner + Pattern: {match_type_counts['all_three']}")
         print(f"    Model + Owner: {match_type_counts['model_owner']}")
@@ -718,6 +849,17 @@ def main():
     # Get project root directory
     project_root = Path(__file__).parent.parent
     
+    # LOG_LEVEL=DEBUG from config enables the per-aircraft EMS code trace
+    sys.path.insert(0, str(project_root))
+    try:
+        import config
+        log_level = config.LOG_LEVEL
+    except (ImportError, AttributeError):
+        log_level = "INFO"
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=log_level.upper(), handlers=[handler])
+    
     filter_obj = EMSAircraftFilter(project_root)
     ems_aircraft = filter_obj.run()
     
@@ -13,12 +13,99 @@ import csv
 import re
 import os
 import json
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:
+    # Optional dependency - fall back to stdlib json
+    orjson = None
 
-@dataclass
+# Model string normalization patterns (compiled once, used for every ACFTREF row)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Business suffixes stripped (in this order) from the end of owner names
+_OWNER_SUFFIX_RES = [
+    re.compile(rf'{re.escape(suffix)}\s*$', re.IGNORECASE)
+    for suffix in (' LLC', ' INC', ' CORP', ' CORPORATION', ' LTD', ' LIMITED',
+                   ' LP', ' LLP', ' PC', ' PLLC', ' LLC.', ' INC.', ' CORP.')
+]
+
+# Mode S code format: exactly 6 hex characters
+_MODE_S_HEX_RE = re.compile(r'^[0-9A-F]{6}$')
+
+# Police-specific N-number suffixes after N + digits (e.g. N123PD), keyed by suffix
+_N_NUMBER_SUFFIX_LABELS = {
+    'PD': 'Police Department',
+    'SO': "Sheriff's Office",
+    'SP': 'State Police',
+    'HP': 'Highway Patrol',
+    'LE': 'Law Enforcement',
+    'ST': 'State',
+}
+
+# MASTER.txt columns read by filter_aircraft, in unpacking order (besides N-NUMBER,
+# which is located separately to tolerate a BOM or "N NUMBER" header)
+MASTER_COLUMNS = (
+    'MFR MDL CODE', 'NAME', 'STATUS CODE', 'TYPE REGISTRANT', 'MODE S CODE HEX',
+    'CITY', 'STATE', 'TYPE AIRCRAFT', 'TYPE ENGINE'
+)
+
+# Markers of a limited liability company in an (uppercase) owner name
+_LLC_INDICATORS = (' LLC', ' LLC.', ' LIMITED LIABILITY', ' L.L.C.', ' L L C')
+
+
+def _trie_pattern(keywords: Set[str]) -> str:
+    """
+    Build a regex for a keyword set with shared prefixes factored out, e.g.
+    {'BK117', 'BELL 407'} -> 'B(?:ELL 407|K117)'. The engine then walks one
+    prefix branch per position instead of trying every keyword in turn;
+    the longest keyword still wins at a given position.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-keyword marker
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A keyword ends here too: the longer continuations are optional
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+def _keyword_regex(keywords: Set[str], word_boundary_max_len: int = 0) -> re.Pattern:
+    """
+    Compile a keyword set into one prefix-factored alternation, so a single
+    search() scans the text once instead of one substring scan per keyword.
+    
+    Keywords of at most word_boundary_max_len characters only match as whole words.
+    """
+    if not keywords:
+        return re.compile(r'(?!)')  # matches nothing
+    alternatives = [rf'\b{re.escape(keyword)}\b'
+                    for keyword in sorted(keywords, key=len, reverse=True)
+                    if len(keyword) <= word_boundary_max_len]
+    substrings = {keyword for keyword in keywords if len(keyword) > word_boundary_max_len}
+    if substrings:
+        alternatives.append(_trie_pattern(substrings))
+    return re.compile('|'.join(alternatives))
+
+
+@dataclass(slots=True)
 class PoliceAircraft:
     """Represents a filtered police aircraft with metadata."""
     n_number: str
@@ -45,8 +132,11 @@ class PoliceAircraftFilter:
         self.master_file = data_dir / "ReleasableAircraft" / "MASTER.txt"
         self.acftref_file = data_dir / "ReleasableAircraft" / "ACFTREF.txt"
         
-        # Model code to model info mapping
-        self.model_lookup: Dict[str, Dict[str, str]] = {}
+        # Model code to (manufacturer, model, model_normalized) mapping
+        self.model_lookup: Dict[str, Tuple[str, str, str]] = {}
+        
+        # ACFTREF model codes whose model matches a police pattern (built by run())
+        self.police_model_codes: Set[str] = set()
         
         # Police model patterns (helicopters and fixed-wing commonly used by police)
         # Many police departments use similar helicopters to EMS
@@ -118,13 +208,32 @@ class PoliceAircraftFilter:
                                  'B737', 'B747', 'B757', 'B767', 'B777', 'B787',
                                  'MD80', 'MD90', 'MD11', 'CRJ', 'ERJ', 'E170', 'E175'}
         
-    def normalize_model_string(self, model: str) -> str:
-        """Normalize model string for matching: uppercase, strip punctuation."""
+        # Single-pass matchers for the keyword sets checked on every MASTER row
+        # (short owner keywords like PD, SO, SP, HP, LE require word boundaries)
+        self._owner_keyword_re = _keyword_regex(self.police_keywords, word_boundary_max_len=3)
+        self._police_keyword_re = _keyword_regex(self.police_keywords)
+        self._police_model_re = _keyword_regex(self.police_model_patterns)
+        self._museum_re = _keyword_regex(self.museum_keywords)
+        self._commercial_re = _keyword_regex(self.commercial_exclusion_keywords)
+        self._llc_re = _keyword_regex(set(_LLC_INDICATORS))
+        self._airline_re = _keyword_regex(self.airline_patterns)
+        
+        # ACFTREF model codes excluded as airline aircraft (built with the lookup)
+        self._airline_excluded_codes: Set[str] = set()
+        
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def normalize_model_string(model: str) -> str:
+        """
+        Normalize model string for matching: uppercase, strip punctuation.
+        
+        Cached: ACFTREF repeats the same model strings across many codes.
+        """
         if not model:
             return ""
         # Remove punctuation and extra spaces
-        normalized = re.sub(r'[^\w\s]', '', model.upper())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _PUNCT_RE.sub('', model.upper())
+        normalized = _WS_RE.sub(' ', normalized).strip()
         return normalized
     
     def load_aircraft_reference(self) -> None:
@@ -133,74 +242,78 @@ class PoliceAircraftFilter:
             raise FileNotFoundError(f"ACFTREF file not found: {self.acftref_file}")
         
         with open(self.acftref_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader rows indexed by column position (no per-row dict)
+            reader = csv.reader(f)
             
-            if not reader.fieldnames:
+            fieldnames = next(reader, None)
+            if not fieldnames:
                 raise ValueError("Could not read header from ACFTREF file")
             
-            # Find the actual column keys
-            code_key = None
-            mfr_key = None
-            model_key = None
+            # Find the actual column positions
+            code_idx = None
+            mfr_idx = None
+            model_idx = None
             
-            for key in reader.fieldnames:
+            for i, key in enumerate(fieldnames):
                 if key:
                     key_clean = key.strip().lstrip('\ufeff')
                     if key_clean == 'CODE':
-                        code_key = key
+                        code_idx = i
                     elif key_clean == 'MFR':
-                        mfr_key = key
+                        mfr_idx = i
                     elif key_clean == 'MODEL':
-                        model_key = key
+                        model_idx = i
             
             # Fallback: use first few columns if standard names not found
-            if not code_key:
-                valid_keys = [k for k in reader.fieldnames if k and k.strip()]
-                if len(valid_keys) >= 3:
-                    code_key = valid_keys[0]
-                    mfr_key = valid_keys[1] if not mfr_key else mfr_key
-                    model_key = valid_keys[2] if not model_key else model_key
-                    print(f"Warning: Using positional columns. Found: {valid_keys[:3]}")
+            if code_idx is None:
+                valid_idx = [i for i, k in enumerate(fieldnames) if k and k.strip()]
+                if len(valid_idx) >= 3:
+                    code_idx = valid_idx[0]
+                    mfr_idx = valid_idx[1] if mfr_idx is None else mfr_idx
+                    model_idx = valid_idx[2] if model_idx is None else model_idx
+                    print(f"Warning: Using positional columns. Found: {[fieldnames[i] for i in valid_idx[:3]]}")
                 else:
-                    raise ValueError(f"Could not find CODE column. Available: {reader.fieldnames[:5]}")
+                    raise ValueError(f"Could not find CODE column. Available: {fieldnames[:5]}")
             
             for row in reader:
-                code = row.get(code_key, '').strip() if code_key else ''
+                if not row:
+                    continue  # Blank line
+                
+                code = row[code_idx].strip()
                 if not code:
                     continue
                 
-                mfr = row.get(mfr_key, '').strip() if mfr_key else ''
-                model = row.get(model_key, '').strip() if model_key else ''
+                mfr = row[mfr_idx].strip() if mfr_idx is not None else ''
+                model = row[model_idx].strip() if model_idx is not None else ''
+                
+                model_normalized = self.normalize_model_string(model)
+                self.model_lookup[code] = (mfr, model, model_normalized)
                 
-                self.model_lookup[code] = {
-                    'manufacturer': mfr,
-                    'model': model,
-                    'model_normalized': self.normalize_model_string(model)
-                }
+                # The airline exclusion only depends on the model, so decide it once per code
+                if self._airline_re.search(model_normalized):
+                    self._airline_excluded_codes.add(code)
+                else:
+                    self._airline_excluded_codes.discard(code)
         
         print(f"Loaded {len(self.model_lookup)} aircraft model references")
     
     def matches_police_model(self, model_code: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Check if model code matches any police model pattern.
+        
+        police_model_codes (built by run()) holds every code whose normalized or
+        raw model matches a pattern, so most rows are rejected by a set lookup.
         Returns: (matches, model_name, manufacturer)
         """
-        if not model_code:
-            return False, None, None
-        
-        if model_code not in self.model_lookup:
+        if model_code not in self.police_model_codes:
             return False, None, None
         
-        model_info = self.model_lookup[model_code]
-        model_normalized = model_info['model_normalized']
-        model_name = model_info['model']
-        manufacturer = model_info['manufacturer']
+        manufacturer, model_name, model_normalized = self.model_lookup[model_code]
         
-        # Check if normalized model matches any police pattern
-        for pattern in self.police_model_patterns:
-            # Use prefix matching and substring matching for flexibility
-            if model_normalized.startswith(pattern) or pattern in model_normalized:
-                return True, model_name, manufacturer
+        # Check if normalized model contains any police pattern (candidates that
+        # only matched on the raw model, e.g. 'PC-12/47E', are not model matches)
+        if self._police_model_re.search(model_normalized):
+            return True, model_name, manufacturer
         
         return False, None, None
     
@@ -212,18 +325,22 @@ class PoliceAircraftFilter:
         if not owner_name:
             return ""
         
-        normalized = owner_name.upper()
+        return self._normalize_owner_upper(owner_name.upper())
+    
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _normalize_owner_upper(normalized: str) -> str:
+        """
+        normalize_owner_name() for an owner name that is already uppercase.
         
+        Cached: fleet operators and holding companies own many aircraft each.
+        """
         # Remove common business suffixes
-        suffixes = [' LLC', ' INC', ' CORP', ' CORPORATION', ' LTD', ' LIMITED',
-                   ' LP', ' LLP', ' PC', ' PLLC', ' LLC.', ' INC.', ' CORP.']
-        for suffix in suffixes:
-            normalized = re.sub(rf'{re.escape(suffix)}\s*$', '', normalized, flags=re.IGNORECASE)
+        for suffix_re in _OWNER_SUFFIX_RES:
+            normalized = suffix_re.sub('', normalized)
         
         # Normalize whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
+        return _WS_RE.sub(' ', normalized).strip()
     
     def matches_owner_keywords(self, owner_name: str) -> bool:
         """
@@ -232,72 +349,64 @@ class PoliceAircraftFilter:
         """
         if not owner_name:
             return False
+        return self._matches_owner_keywords_upper(owner_name.upper())
+    
+    def _matches_owner_keywords_upper(self, owner_upper: str) -> bool:
+        """matches_owner_keywords() for an owner name that is already uppercase."""
+        owner_normalized = self._normalize_owner_upper(owner_upper)
         
-        owner_normalized = self.normalize_owner_name(owner_name)
-        
-        # Check for keywords in normalized name
-        for keyword in self.police_keywords:
-            # Use word boundary matching for short keywords
-            if len(keyword) <= 3:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, owner_normalized):
-                    return True
-            else:
-                if keyword in owner_normalized:
-                    return True
-        return False
+        # Check for keywords in normalized name (word boundaries for short keywords,
+        # substring matching for longer ones)
+        return self._owner_keyword_re.search(owner_normalized) is not None
     
-    def should_exclude(self, row: Dict[str, str]) -> Tuple[bool, str]:
+    def should_exclude(self, status_code: str, owner_name: str, model_code: str,
+                       type_registrant: str, owner_upper: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check if aircraft should be excluded.
+        Takes the stripped MASTER fields (STATUS CODE, NAME, MFR MDL CODE,
+        TYPE REGISTRANT), plus owner_name.upper() if the caller already has it.
         Returns: (should_exclude, reason)
         """
+        # Cheapest checks first: each exclusion is independent, so the order only
+        # decides which reason a row matching several of them is counted under
+        
         # Exclude inactive registrations
-        status_code = row.get('STATUS CODE', '').strip()
         if status_code != 'V':
             return True, f"Status code: {status_code}"
         
-        # Exclude museum-owned aircraft
-        owner_name = row.get('NAME', '').strip().upper()
-        if owner_name:
-            for museum_keyword in self.museum_keywords:
-                if museum_keyword in owner_name:
-                    return True, f"Museum-owned: {row.get('NAME', '').strip()[:50]}"
-            
-            # Exclude commercial cargo/logistics companies (FedEx, etc.)
-            for exclusion_keyword in self.commercial_exclusion_keywords:
-                if exclusion_keyword in owner_name:
-                    return True, f"Commercial cargo: {row.get('NAME', '').strip()[:50]}"
-        
-        # Exclude airline aircraft by model
-        model_code = row.get('MFR MDL CODE', '').strip()
-        if model_code in self.model_lookup:
-            model_name = self.model_lookup[model_code]['model']
-            model_normalized = self.normalize_model_string(model_name)
-            
-            for airline_pattern in self.airline_patterns:
-                if airline_pattern in model_normalized:
-                    return True, f"Airline aircraft: {model_name}"
-        
         # Exclude individual owners (TYPE REGISTRANT = 1)
-        type_registrant = row.get('TYPE REGISTRANT', '').strip()
         if type_registrant == '1':
             return True, "Individual owner"
         
+        # Exclude airline aircraft by model (precomputed per code in load_aircraft_reference)
+        if model_code in self._airline_excluded_codes:
+            _, model_name, _ = self.model_lookup[model_code]
+            return True, f"Airline aircraft: {model_name}"
+        
+        # Exclude museum-owned aircraft
+        if owner_upper is None:
+            owner_upper = owner_name.upper()
+        if owner_upper:
+            if self._museum_re.search(owner_upper):
+                return True, f"Museum-owned: {owner_name[:50]}"
+            
+            # Exclude commercial cargo/logistics companies (FedEx, etc.)
+            if self._commercial_re.search(owner_upper):
+                return True, f"Commercial cargo: {owner_name[:50]}"
+        
         # Exclude private LLCs that don't contain police/law enforcement keywords
         # This excludes generic private ownership but keeps legitimate police service LLCs
-        if owner_name:
+        if owner_upper:
             # Check if it's an LLC
-            is_llc = any(llc_indicator in owner_name for llc_indicator in 
-                        [' LLC', ' LLC.', ' LIMITED LIABILITY', ' L.L.C.', ' L L C'])
+            is_llc = self._llc_re.search(owner_upper) is not None
             
             if is_llc:
                 # Check if it contains any police/law enforcement keywords
                 # If it's an LLC but has police keywords, keep it (e.g., "ABC Police Department LLC")
-                has_police_keyword = any(keyword in owner_name for keyword in self.police_keywords)
+                has_police_keyword = self._police_keyword_re.search(owner_upper) is not None
                 
                 if not has_police_keyword:
-                    return True, f"Private LLC (no police keywords): {row.get('NAME', '').strip()[:50]}"
+                    return True, f"Private LLC (no police keywords): {owner_name[:50]}"
         
         return False, ""
     
@@ -306,7 +415,7 @@ class PoliceAircraftFilter:
         if not mode_s_hex:
             return False
         mode_s_hex_upper = mode_s_hex.upper().strip()
-        return bool(re.match(r'^[0-9A-F]{6}$', mode_s_hex_upper))
+        return bool(_MODE_S_HEX_RE.match(mode_s_hex_upper))
     
     def filter_aircraft(self) -> List[PoliceAircraft]:
         """Filter FAA MASTER database for police aircraft."""
@@ -327,26 +436,45 @@ class PoliceAircraftFilter:
         
         print("Filtering aircraft database...")
         with open(self.master_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader rows indexed by column position (no per-row dict)
+            reader = csv.reader(f)
+            fieldnames = next(reader, None) or []
             
-            # Find N-NUMBER column
-            n_number_key = None
-            if reader.fieldnames:
-                for key in reader.fieldnames:
-                    if key:
-                        key_clean = key.strip().lstrip('\ufeff')
-                        if key_clean == 'N-NUMBER' or key_clean == 'N NUMBER':
-                            n_number_key = key
-                            break
-                if not n_number_key:
-                    n_number_key = reader.fieldnames[0] if reader.fieldnames else 'N-NUMBER'
+            # Find N-NUMBER column (first column if not found)
+            n_number_idx = 0
+            for i, key in enumerate(fieldnames):
+                if key:
+                    key_clean = key.strip().lstrip('\ufeff')
+                    if key_clean == 'N-NUMBER' or key_clean == 'N NUMBER':
+                        n_number_idx = i
+                        break
+            
+            # Resolve the remaining column positions once
+            columns = {key: i for i, key in enumerate(fieldnames)}
+            missing = [key for key in MASTER_COLUMNS if key not in columns]
+            if missing:
+                raise ValueError(f"MASTER file is missing columns: {missing}")
             
-            for idx, row in enumerate(reader):
+            # Project each row onto just the columns used and strip every field once
+            get_fields = itemgetter(n_number_idx, *(columns[key] for key in MASTER_COLUMNS))
+            intern = sys.intern
+            
+            # filter(None, ...) skips blank lines, as DictReader did
+            for idx, row in enumerate(filter(None, reader)):
                 if idx > 0 and idx % 10000 == 0:
                     print(f"  Processed {idx} aircraft... (Found {len(police_aircraft)} police, Excluded {excluded_count})")
                 
+                (n_number, model_code, owner_name, status_code, type_registrant, mode_s_hex,
+                 owner_city, owner_state, type_aircraft, type_engine) = map(str.strip, get_fields(row))
+                # Short codes repeat across rows, so share one string per value, and
+                # uppercase the owner name once for all checks
+                status_code = intern(status_code)
+                model_code = intern(model_code)
+                owner_upper = owner_name.upper()
+                
                 # Check exclusions
-                should_exclude, exclude_reason = self.should_exclude(row)
+                should_exclude, exclude_reason = self.should_exclude(
+                    status_code, owner_name, model_code, type_registrant, owner_upper)
                 if should_exclude:
                     excluded_count += 1
                     excluded_reasons[exclude_reason] = excluded_reasons.get(exclude_reason, 0) + 1
@@ -363,19 +491,12 @@ class PoliceAircraftFilter:
                         private_llc_excluded_count += 1
                     continue
                 
-                # Extract data
-                n_number = (row.get('N-NUMBER', '') or 
-                           (row.get(n_number_key, '') if n_number_key else '')).strip()
-                
                 if not n_number:
                     continue
                 
-                mode_s_hex = row.get('MODE S CODE HEX', '').strip()
-                status_code = row.get('STATUS CODE', '').strip()
-                
                 # Validate Mode S code format
                 if mode_s_hex:
-                    mode_s_hex_upper = mode_s_hex.upper().strip()
+                    mode_s_hex_upper = mode_s_hex.upper()
                     if not self.is_valid_mode_s_hex(mode_s_hex_upper):
                         invalid_mode_s_count += 1
                         continue
@@ -385,19 +506,17 @@ class PoliceAircraftFilter:
                     continue
                 
                 match_reasons = []
-                model_code = row.get('MFR MDL CODE', '').strip()
-                owner_name = row.get('NAME', '').strip()
                 
                 model_match, model_name, manufacturer = self.matches_police_model(model_code)
                 
                 # If model code exists in lookup but wasn't matched as police model,
                 # still get the model name and manufacturer for database
-                if not model_name and model_code and model_code in self.model_lookup:
-                    model_info = self.model_lookup[model_code]
-                    model_name = model_info.get('model', '')
-                    manufacturer = model_info.get('manufacturer', '')
+                if not model_name:
+                    model_info = self.model_lookup.get(model_code)
+                    if model_info is not None:
+                        manufacturer, model_name, _ = model_info
                 
-                owner_match = self.matches_owner_keywords(owner_name)
+                owner_match = self._matches_owner_keywords_upper(owner_upper)
                 
                 if model_match:
                     model_match_count += 1
@@ -409,30 +528,13 @@ class PoliceAircraftFilter:
                 n_number_upper = n_number.upper() if n_number else ""
                 
                 if n_number_upper:
-                    # Police Department pattern: N-numbers ending in "PD" (e.g., N123PD)
-                    if re.match(r'^N\d+PD$', n_number_upper):
-                        n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (Police Department)")
-                    # Sheriff's Office pattern: N-numbers ending in "SO" (e.g., N123SO)
-                    elif re.match(r'^N\d+SO$', n_number_upper):
+                    # Police-specific suffix after the digits (e.g., N123PD, N123SO):
+                    # look the suffix up first, then check for N + digits (same as
+                    # matching ^N\d+(PD|SO|SP|HP|LE|ST)$, without a regex per row)
+                    label = _N_NUMBER_SUFFIX_LABELS.get(n_number_upper[-2:])
+                    if label and n_number_upper[0] == 'N' and n_number_upper[1:-2].isdecimal():
                         n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (Sheriff's Office)")
-                    # State Police pattern: N-numbers ending in "SP" (e.g., N123SP)
-                    elif re.match(r'^N\d+SP$', n_number_upper):
-                        n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (State Police)")
-                    # Highway Patrol pattern: N-numbers ending in "HP" (e.g., N123HP)
-                    elif re.match(r'^N\d+HP$', n_number_upper):
-                        n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (Highway Patrol)")
-                    # Law Enforcement pattern: N-numbers ending in "LE" (e.g., N123LE)
-                    elif re.match(r'^N\d+LE$', n_number_upper):
-                        n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (Law Enforcement)")
-                    # State Patrol pattern: N-numbers ending in "ST" (e.g., N123ST)
-                    elif re.match(r'^N\d+ST$', n_number_upper):
-                        n_number_pattern_match = True
-                        match_reasons.append("N-number pattern (State)")
+                        match_reasons.append(f"N-number pattern ({label})")
                 
                 if n_number_pattern_match:
                     n_pattern_match_count += 1
@@ -470,12 +572,12 @@ class PoliceAircraftFilter:
                         model_name=model_name or "Unknown",
                         manufacturer=manufacturer or "Unknown",
                         owner_name=owner_name,
-                        owner_city=row.get('CITY', '').strip(),
-                        owner_state=row.get('STATE', '').strip(),
+                        owner_city=owner_city,
+                        owner_state=owner_state,
                         match_reasons=match_reasons,
                         confidence=confidence,
-                        type_aircraft=row.get('TYPE AIRCRAFT', '').strip(),
-                        type_engine=row.get('TYPE ENGINE', '').strip(),
+                        type_aircraft=type_aircraft,
+                        type_engine=type_engine,
                         status_code=status_code
                     )
                     
@@ -506,20 +608,15 @@ class PoliceAircraftFilter:
         print("Loading aircraft reference database...")
         self.load_aircraft_reference()
         
-        # Build set of police model codes
+        # Build set of police model codes (candidates for matches_police_model)
         police_model_codes = set()
         print("Scanning all model references for police patterns...")
-        for code, info in self.model_lookup.items():
-            model_norm = info.get('model_normalized', '')
-            model_name = info.get('model', '')
+        search_patterns = self._police_model_re.search
+        for code, (_, model_name, model_norm) in self.model_lookup.items():
             
-            for pattern in self.police_model_patterns:
-                if (model_norm.startswith(pattern) or 
-                    pattern in model_norm or
-                    model_name.upper().startswith(pattern) or
-                    pattern in model_name.upper()):
-                    police_model_codes.add(code)
-                    break
+            # Substring matching also covers prefix matches
+            if search_patterns(model_norm) or search_patterns(model_name.upper()):
+                police_model_codes.add(code)
         
         self.police_model_codes = police_model_codes
         print(f"Found {len(police_model_codes)} potential police models in reference database")
@@ -574,21 +671,24 @@ class PoliceAircraftFilter:
 
 
 def save_to_json(aircraft_list: List[PoliceAircraft], output_path: Path):
-    """Save filtered aircraft to JSON file."""
+    """Save filtered aircraft to JSON file, using orjson when available."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    aircraft_dicts = [asdict(ac) for ac in aircraft_list]
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(aircraft_dicts, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson serializes dataclasses natively (no asdict() copies)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(aircraft_list, option=orjson.OPT_INDENT_2))
+    else:
+        # default=asdict converts each record as the encoder reaches it, and
+        # json.dump writes the chunks out as it goes (no list of dicts)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(aircraft_list, f, indent=2, ensure_ascii=False, default=asdict)
     
     print(f"\nSaved {len(aircraft_list)} police aircraft to {output_path}")
 
 
 def main():
     """Main entry point."""
-    import sys
-    
     # Get project root directory
     project_root = Path(__file__).parent.parent
     
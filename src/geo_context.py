@@ -8,34 +8,352 @@ near airport) and enriching anomalies with hospital proximity.
 
 import csv
 import math
+import threading
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-# Lazy-loaded data; None until first use
-_airports: Optional[List[Tuple[float, float, str]]] = None
-_hospitals: Optional[List[Tuple[float, float, str]]] = None
+_EARTH_RADIUS_KM = 6371.0
+_DEG2RAD = math.pi / 180.0
+_HALF_DEG2RAD = _DEG2RAD * 0.5
+
+# Nearest-point queries are cached per 0.001 deg cell (~100 m).
+_NEAREST_CELLS_PER_DEG = 1000
+_NEAREST_CACHE_SIZE = 8192
+
+# Lazy-loaded data shared by every GeoContext; None until first use
+_airports: Optional["_PointTable"] = None
+_hospitals: Optional["_PointTable"] = None
 _airports_path: Optional[Path] = None
 _hospitals_path: Optional[Path] = None
 _load_warned_airports: bool = False
 _load_warned_hospitals: bool = False
+_load_lock = threading.Lock()
 
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Return great-circle distance in km between (lat1, lon1) and (lat2, lon2)."""
-    R = 6371.0  # Earth radius in km
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlam = math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
-
-
-def _load_airports(path: Path) -> List[Tuple[float, float, str]]:
-    """Load OurAirports CSV; return list of (lat, lon, name). Skip invalid rows."""
+    phi1 = lat1 * _DEG2RAD
+    phi2 = lat2 * _DEG2RAD
+    s1 = math.sin((phi2 - phi1) * 0.5)
+    s2 = math.sin((lon2 - lon1) * _HALF_DEG2RAD)
+    a = s1 * s1 + math.cos(phi1) * math.cos(phi2) * s2 * s2
+    # min() guards against rounding pushing sqrt(a) just past 1 for antipodes
+    return _EARTH_RADIUS_KM * 2 * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_float_pair(lat, lon) -> Optional[Tuple[float, float]]:
+    """Coerce a query (lat, lon) to floats; None if either is missing or not numeric."""
+    if lat is None or lon is None:
+        return None
+    try:
+        return (float(lat), float(lon))
+    except (TypeError, ValueError):
+        return None
+
+
+def _unit_vector(lat: float, lon: float) -> Tuple[float, float, float]:
+    """Project (lat, lon) in degrees onto the unit sphere as (x, y, z)."""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+# Latitude bands and bounding boxes are widened by about 1 m so float rounding
+# (in acos near 1 especially) never drops a point sitting on their edge.
+_BBOX_SLACK_DEG = 1e-5
+# Half-width of the first latitude band tried by the band-scan fallback.
+_NEAREST_BAND_DEG = 0.25
+# Points are also bucketed into square grid cells of 1 / _GRID_CELLS_PER_DEG
+# degrees; search boxes covering more cells than _GRID_MAX_CELLS (huge radii,
+# near the poles) use the latitude-band scan.
+_GRID_CELLS_PER_DEG = 1
+_GRID_MAX_CELLS = 2000
+
+
+def _grid_cell(lat: float, lon: float) -> Tuple[int, int]:
+    """Return the grid cell holding (lat, lon); lon 180 shares the cell just west of it."""
+    j = math.floor(lon * _GRID_CELLS_PER_DEG)
+    return (math.floor(lat * _GRID_CELLS_PER_DEG), j if lon < 180.0 else j - 1)
+
+
+def _box_cells(lat_lo: float, lat_hi: float, lon_lo: float, lon_hi: float) -> Optional[List[Tuple[int, int]]]:
+    """
+    Return the grid cells covering a lat/lon box, wrapping longitude across the
+    antimeridian, or None if the box spans more than _GRID_MAX_CELLS cells.
+    """
+    i0 = math.floor(lat_lo * _GRID_CELLS_PER_DEG)
+    i1 = math.floor(lat_hi * _GRID_CELLS_PER_DEG)
+    j0 = math.floor(lon_lo * _GRID_CELLS_PER_DEG)
+    j1 = math.floor(lon_hi * _GRID_CELLS_PER_DEG)
+    if (i1 - i0 + 1) * (j1 - j0 + 1) > _GRID_MAX_CELLS:
+        return None
+    half_turn = 180 * _GRID_CELLS_PER_DEG
+    return [
+        (i, (j + half_turn) % (2 * half_turn) - half_turn)
+        for i in range(i0, i1 + 1)
+        for j in range(j0, j1 + 1)
+    ]
+
+
+def _lon_half_width(lat: float, ang: float) -> Optional[float]:
+    """
+    Longitude half-width in degrees of a circle of angular radius ang (radians)
+    around latitude lat, or None if the circle reaches a pole.
+    """
+    phi = lat * _DEG2RAD
+    if ang >= math.pi / 2 - abs(phi):
+        return None
+    return math.degrees(math.asin(math.sin(ang) / math.cos(phi))) + _BBOX_SLACK_DEG
+
+
+class _PointTable:
+    """
+    Reference points as parallel columns instead of (lat, lon, name) tuples.
+
+    xyz holds each point's unit vector and cos_lats the cosine of its latitude,
+    both computed once at load time, so the nearest-point and radius scans read
+    only floats; names are touched for the winner only.
+    """
+
+    __slots__ = ("lats", "lons", "names", "xyz", "cos_lats", "grid")
+
+    def __init__(self):
+        self.lats: List[float] = []
+        self.lons: List[float] = []
+        self.names: List[str] = []
+        self.xyz: List[Tuple[float, float, float]] = []
+        self.cos_lats: List[float] = []
+        self.grid: Dict[Tuple[int, int], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, lat: float, lon: float, name: str) -> None:
+        self.lats.append(lat)
+        self.lons.append(lon)
+        self.names.append(name)
+        self.xyz.append(_unit_vector(lat, lon))
+        self.cos_lats.append(math.cos(lat * _DEG2RAD))
+
+    def build_index(self) -> None:
+        """
+        Reorder all columns by latitude, so the fallback scans can bisect to a
+        latitude band, and bucket point indices into grid cells.
+        """
+        order = sorted(range(len(self.lats)), key=self.lats.__getitem__)
+        self.lats = [self.lats[i] for i in order]
+        self.lons = [self.lons[i] for i in order]
+        self.names = [self.names[i] for i in order]
+        self.xyz = [self.xyz[i] for i in order]
+        self.cos_lats = [self.cos_lats[i] for i in order]
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for i, (lat, lon) in enumerate(zip(self.lats, self.lons)):
+            grid.setdefault(_grid_cell(lat, lon), []).append(i)
+        self.grid = grid
+
+
+def _nearest_index(points: _PointTable, lat: float, lon: float) -> int:
+    """
+    Return the index of the point nearest to finite (lat, lon).
+
+    Great-circle distance is monotonic in the chord between unit vectors, so the
+    nearest point is the one with the largest dot product. A square of grid
+    cells around the query, grown until it holds a point, gives a first best
+    match; every point at least as close lies inside that match's bounding box,
+    so if the box fits the square the answer is final, otherwise the cells
+    covering the box are scanned once.
+    """
+    qx, qy, qz = _unit_vector(lat, lon)
+    grid = points.grid
+    xyz = points.xyz
+    lon_c = (lon + 180.0) % 360.0 - 180.0
+    step = 1.0 / _GRID_CELLS_PER_DEG
+    # Square edges in degrees, snapped to the grid, one cell out on each side
+    sq_lat_lo = math.floor(lat * _GRID_CELLS_PER_DEG) * step - step
+    sq_lon_lo = math.floor(lon_c * _GRID_CELLS_PER_DEG) * step - step
+    sq_lat_hi = sq_lat_lo + 3 * step
+    sq_lon_hi = sq_lon_lo + 3 * step
+    while True:
+        cells = _box_cells(sq_lat_lo, sq_lat_hi - step, sq_lon_lo, sq_lon_hi - step)
+        if cells is None:
+            return _nearest_index_in_band(points, qx, qy, qz, lat)
+        candidates = [k for cell in cells for k in grid.get(cell, ())]
+        if candidates:
+            break
+        grow = sq_lat_hi - sq_lat_lo
+        sq_lat_lo -= grow
+        sq_lat_hi += grow
+        sq_lon_lo -= grow
+        sq_lon_hi += grow
+    dots = [qx * x + qy * y + qz * z for x, y, z in map(xyz.__getitem__, candidates)]
+    best_dot = max(dots)
+    reach = math.acos(min(best_dot, 1.0))
+    dlat = math.degrees(reach) + _BBOX_SLACK_DEG
+    dlon = _lon_half_width(lat, reach)
+    if dlon is None:
+        return _nearest_index_in_band(points, qx, qy, qz, lat)
+    lat_lo = lat - dlat
+    lat_hi = lat + dlat
+    lon_lo = lon_c - dlon
+    lon_hi = lon_c + dlon
+    if lat_lo >= sq_lat_lo and lat_hi < sq_lat_hi and lon_lo >= sq_lon_lo and lon_hi < sq_lon_hi:
+        return candidates[dots.index(best_dot)]
+    cells = _box_cells(lat_lo, lat_hi, lon_lo, lon_hi)
+    if cells is None:
+        return _nearest_index_in_band(points, qx, qy, qz, lat)
+    candidates = [k for cell in cells for k in grid.get(cell, ())]
+    dots = [qx * x + qy * y + qz * z for x, y, z in map(xyz.__getitem__, candidates)]
+    return candidates[dots.index(max(dots))]
+
+
+def _nearest_index_in_band(points: _PointTable, qx: float, qy: float, qz: float, lat: float) -> int:
+    """
+    Nearest-point fallback for sparse areas and polar queries, by latitude band.
+
+    Points are sorted by latitude and no point outside a latitude band can be
+    closer than the band's half-width, so only the band around the query is
+    scanned; if the best match in it is farther than the half-width, the band is
+    widened to that distance once and rescanned, which is then exact.
+    """
+    lats = points.lats
+    xyz = points.xyz
+    half = _NEAREST_BAND_DEG
+    while True:
+        lo = bisect_left(lats, lat - half)
+        hi = bisect_right(lats, lat + half)
+        if lo == hi:
+            half = 180.0
+            continue
+        # One pass over the band, then the argmax in C via max()/index().
+        dots = [qx * x + qy * y + qz * z for x, y, z in xyz[lo:hi]]
+        best_dot = max(dots)
+        reach = math.degrees(math.acos(min(best_dot, 1.0)))
+        if reach <= half or (lo == 0 and hi == len(lats)):
+            return lo + dots.index(best_dot)
+        half = reach + _BBOX_SLACK_DEG
+
+
+def _nearest_cell_cache(points: _PointTable) -> Callable[[int, int], int]:
+    """
+    Return an LRU-cached (lat_q, lon_q) -> nearest index lookup over points.
+
+    Tracked aircraft report near-identical positions tick after tick, so queries
+    are quantized to _NEAREST_CELLS_PER_DEG cells and the scan runs once per
+    cell. The closure holds the table rather than the GeoContext, and a fresh
+    cache is built whenever the table is (re)loaded.
+    """
+    @lru_cache(maxsize=_NEAREST_CACHE_SIZE)
+    def nearest_in_cell(lat_q: int, lon_q: int) -> int:
+        return _nearest_index(points, lat_q / _NEAREST_CELLS_PER_DEG, lon_q / _NEAREST_CELLS_PER_DEG)
+    return nearest_in_cell
+
+
+def _nearest_point(
+    points: _PointTable,
+    nearest_in_cell: Callable[[int, int], int],
+    lat: float,
+    lon: float,
+) -> Tuple[float, Optional[str]]:
+    """Return (distance_km, name) of the nearest point; (inf, None) for non-finite input."""
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        return (float("inf"), None)
+    i = nearest_in_cell(round(lat * _NEAREST_CELLS_PER_DEG), round(lon * _NEAREST_CELLS_PER_DEG))
+    # Distance is measured from the exact query, not the cell it was cached under.
+    return (haversine_km(lat, lon, points.lats[i], points.lons[i]), points.names[i])
+
+
+def _nearest_batch(
+    points: _PointTable,
+    nearest_in_cell: Callable[[int, int], int],
+    lats: Sequence[float],
+    lons: Sequence[float],
+) -> Tuple[List[float], List[Optional[str]]]:
+    """Return parallel (distances_km, names) for each (lats[i], lons[i]) query."""
+    distances: List[float] = []
+    names: List[Optional[str]] = []
+    for lat, lon in zip(lats, lons):
+        query = _to_float_pair(lat, lon)
+        if query is None or not points:
+            km, name = float("inf"), None
+        else:
+            km, name = _nearest_point(points, nearest_in_cell, query[0], query[1])
+        distances.append(km)
+        names.append(name)
+    return (distances, names)
+
+
+def _any_within(points: _PointTable, lat: float, lon: float, radius_km: float) -> bool:
+    """
+    True if any point lies within radius_km of (lat, lon).
+
+    Only the grid cells covering a bounding box around the query are visited
+    (a bisect into the latitude-sorted table when the box is too large for the
+    grid); inside them the box itself is a chained comparison. Points in the box
+    are tested on haversine's intermediate a = sin^2(c / 2) against
+    sin^2(radius / 2R), which skips the sqrt/asin, and the scan stops at the
+    first hit.
+    """
+    if not (math.isfinite(lat) and math.isfinite(lon)) or not points:
+        return False
+    ang = radius_km / _EARTH_RADIUS_KM
+    if ang >= math.pi:
+        return True  # the circle covers the whole sphere
+    dlat = math.degrees(ang) + _BBOX_SLACK_DEG
+    lat_lo = lat - dlat
+    lat_hi = lat + dlat
+    dlon = _lon_half_width(lat, ang)
+    if dlon is None:
+        dlon = 180.0  # the circle reaches a pole, so every longitude qualifies
+    # Longitude window as plain comparisons; a window running past +/-180 also
+    # admits the wrapped-around points on the other side of the antimeridian.
+    lon_c = (lon + 180.0) % 360.0 - 180.0
+    lon_lo = lon_c - dlon
+    lon_hi = lon_c + dlon
+    wrap_lo = lon_lo + 360.0 if lon_lo < -180.0 else math.inf
+    wrap_hi = lon_hi - 360.0 if lon_hi > 180.0 else -math.inf
+    cells = _box_cells(lat_lo, lat_hi, lon_lo, lon_hi) if dlon < 180.0 else None
+    if cells is not None:
+        grid = points.grid
+        indices = [k for cell in cells for k in grid.get(cell, ())]
+    else:
+        indices = range(bisect_left(points.lats, lat_lo), bisect_right(points.lats, lat_hi))
+    s = math.sin(ang * 0.5)
+    a_max = s * s
+    # a within rounding of the threshold is settled by haversine_km itself, so
+    # the result matches comparing full distances exactly.
+    a_lo = a_max * (1 - 1e-6)
+    a_hi = a_max * (1 + 1e-6)
+    cos_phi = math.cos(lat * _DEG2RAD)
+    lats = points.lats
+    lons = points.lons
+    cos_lats = points.cos_lats
+    for i in indices:
+        plat = lats[i]
+        plon = lons[i]
+        if lat_lo <= plat <= lat_hi and (lon_lo <= plon <= lon_hi or plon >= wrap_lo or plon <= wrap_hi):
+            s1 = math.sin((plat - lat) * _HALF_DEG2RAD)
+            s2 = math.sin((plon - lon) * _HALF_DEG2RAD)
+            a = s1 * s1 + cos_phi * cos_lats[i] * s2 * s2
+            if a < a_lo or (a <= a_hi and haversine_km(lat, lon, plat, plon) <= radius_km):
+                return True
+    return False
+
+
+def _column_index(header: List[str], *names: str) -> int:
+    """Return the position of the first of names present in header, or -1."""
+    for name in names:
+        if name in header:
+            return header.index(name)
+    return -1
+
+
+def _load_airports(path: Path) -> _PointTable:
+    """Load OurAirports CSV; return a table of (lat, lon, name). Skip invalid rows."""
     global _load_warned_airports
-    result: List[Tuple[float, float, str]] = []
+    result = _PointTable()
     if not path.exists():
         if not _load_warned_airports:
             _load_warned_airports = True
@@ -44,19 +362,28 @@ def _load_airports(path: Path) -> List[Tuple[float, float, str]]:
         return result
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            lat_i = _column_index(header, "latitude_deg")
+            lon_i = _column_index(header, "longitude_deg")
+            name_i = _column_index(header, "name")
+            if lat_i < 0 or lon_i < 0:
+                return result
+            width = max(lat_i, lon_i, name_i) + 1
             for row in reader:
+                if len(row) < width:
+                    continue
                 try:
-                    lat_s = row.get("latitude_deg", "").strip()
-                    lon_s = row.get("longitude_deg", "").strip()
+                    lat_s = row[lat_i].strip()
+                    lon_s = row[lon_i].strip()
                     if not lat_s or not lon_s:
                         continue
                     lat = float(lat_s)
                     lon = float(lon_s)
-                    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
                         continue
-                    name = (row.get("name") or "").strip() or "Unknown"
-                    result.append((lat, lon, name))
+                    name = (row[name_i].strip() if name_i >= 0 else "") or "Unknown"
+                    result.append(lat, lon, name)
                 except (ValueError, TypeError):
                     continue
     except Exception as e:
@@ -68,10 +395,10 @@ def _load_airports(path: Path) -> List[Tuple[float, float, str]]:
     return result
 
 
-def _load_hospitals(path: Path) -> List[Tuple[float, float, str]]:
+def _load_hospitals(path: Path) -> _PointTable:
     """Load hospitals CSV; expect LATITUDE, LONGITUDE, NAME. Skip invalid rows."""
     global _load_warned_hospitals
-    result: List[Tuple[float, float, str]] = []
+    result = _PointTable()
     if not path.exists():
         if not _load_warned_hospitals:
             _load_warned_hospitals = True
@@ -80,19 +407,28 @@ def _load_hospitals(path: Path) -> List[Tuple[float, float, str]]:
         return result
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            lat_i = _column_index(header, "LATITUDE", "latitude")
+            lon_i = _column_index(header, "LONGITUDE", "longitude")
+            name_i = _column_index(header, "NAME", "name")
+            if lat_i < 0 or lon_i < 0:
+                return result
+            width = max(lat_i, lon_i, name_i) + 1
             for row in reader:
+                if len(row) < width:
+                    continue
                 try:
-                    lat_s = (row.get("LATITUDE") or row.get("latitude") or "").strip()
-                    lon_s = (row.get("LONGITUDE") or row.get("longitude") or "").strip()
+                    lat_s = row[lat_i].strip()
+                    lon_s = row[lon_i].strip()
                     if not lat_s or not lon_s:
                         continue
                     lat = float(lat_s)
                     lon = float(lon_s)
-                    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
                         continue
-                    name = (row.get("NAME") or row.get("name") or "").strip() or "Unknown"
-                    result.append((lat, lon, name))
+                    name = (row[name_i].strip() if name_i >= 0 else "") or "Unknown"
+                    result.append(lat, lon, name)
                 except (ValueError, TypeError):
                     continue
     except Exception as e:
@@ -104,6 +440,28 @@ def _load_hospitals(path: Path) -> List[Tuple[float, float, str]]:
     return result
 
 
+def _shared_airports(path: Path) -> _PointTable:
+    """Return the airports table for path, parsing it at most once per process."""
+    global _airports, _airports_path
+    with _load_lock:
+        if _airports is None or _airports_path != path:
+            points = _load_airports(path)
+            points.build_index()
+            _airports, _airports_path = points, path
+        return _airports
+
+
+def _shared_hospitals(path: Path) -> _PointTable:
+    """Return the hospitals table for path, parsing it at most once per process."""
+    global _hospitals, _hospitals_path
+    with _load_lock:
+        if _hospitals is None or _hospitals_path != path:
+            points = _load_hospitals(path)
+            points.build_index()
+            _hospitals, _hospitals_path = points, path
+        return _hospitals
+
+
 class GeoContext:
     """
     Lazy-loading geographic context: airports and hospitals.
@@ -113,67 +471,77 @@ class GeoContext:
     def __init__(self, airports_path: Path, hospitals_path: Path):
         self.airports_path = Path(airports_path)
         self.hospitals_path = Path(hospitals_path)
-        self._airports: Optional[List[Tuple[float, float, str]]] = None
-        self._hospitals: Optional[List[Tuple[float, float, str]]] = None
+        self._airports: Optional[_PointTable] = None
+        self._hospitals: Optional[_PointTable] = None
+        self._nearest_airport_cell: Optional[Callable[[int, int], int]] = None
+        self._nearest_hospital_cell: Optional[Callable[[int, int], int]] = None
 
-    def _ensure_airports(self) -> List[Tuple[float, float, str]]:
+    def _ensure_airports(self) -> _PointTable:
         if self._airports is None:
-            self._airports = _load_airports(self.airports_path)
+            points = _shared_airports(self.airports_path)
+            self._nearest_airport_cell = _nearest_cell_cache(points)
+            self._airports = points
         return self._airports
 
-    def _ensure_hospitals(self) -> List[Tuple[float, float, str]]:
+    def _ensure_hospitals(self) -> _PointTable:
         if self._hospitals is None:
-            self._hospitals = _load_hospitals(self.hospitals_path)
+            points = _shared_hospitals(self.hospitals_path)
+            self._nearest_hospital_cell = _nearest_cell_cache(points)
+            self._hospitals = points
         return self._hospitals
 
+    def preload(self) -> None:
+        """Load airports and hospitals now rather than on the first query; safe from any thread."""
+        self._ensure_airports()
+        self._ensure_hospitals()
+
     def distance_to_nearest_airport(self, lat: float, lon: float) -> Tuple[float, Optional[str]]:
         """Return (distance_km, name or None). Returns (inf, None) if no data or invalid input."""
-        if lat is None or lon is None:
-            return (float("inf"), None)
-        try:
-            lat_f = float(lat)
-            lon_f = float(lon)
-        except (TypeError, ValueError):
-            return (float("inf"), None)
+        query = _to_float_pair(lat, lon)
         points = self._ensure_airports()
-        if not points:
+        if query is None or not points:
             return (float("inf"), None)
-        best_km = float("inf")
-        best_name: Optional[str] = None
-        for plat, plon, name in points:
-            d = haversine_km(lat_f, lon_f, plat, plon)
-            if d < best_km:
-                best_km = d
-                best_name = name
-        return (best_km, best_name)
+        return _nearest_point(points, self._nearest_airport_cell, query[0], query[1])
 
     def distance_to_nearest_hospital(self, lat: float, lon: float) -> Tuple[float, Optional[str]]:
         """Return (distance_km, name or None). Returns (inf, None) if no data or invalid input."""
-        if lat is None or lon is None:
-            return (float("inf"), None)
-        try:
-            lat_f = float(lat)
-            lon_f = float(lon)
-        except (TypeError, ValueError):
-            return (float("inf"), None)
+        query = _to_float_pair(lat, lon)
         points = self._ensure_hospitals()
-        if not points:
+        if query is None or not points:
             return (float("inf"), None)
-        best_km = float("inf")
-        best_name: Optional[str] = None
-        for plat, plon, name in points:
-            d = haversine_km(lat_f, lon_f, plat, plon)
-            if d < best_km:
-                best_km = d
-                best_name = name
-        return (best_km, best_name)
+        return _nearest_point(points, self._nearest_hospital_cell, query[0], query[1])
 
     def is_near_airport(self, lat: float, lon: float, radius_km: float) -> bool:
         """True if (lat, lon) is within radius_km of any airport."""
-        dist, _ = self.distance_to_nearest_airport(lat, lon)
-        return dist <= radius_km
+        query = _to_float_pair(lat, lon)
+        if query is None:
+            return False
+        return _any_within(self._ensure_airports(), query[0], query[1], radius_km)
 
     def is_near_hospital(self, lat: float, lon: float, radius_km: float) -> bool:
         """True if (lat, lon) is within radius_km of any hospital."""
-        dist, _ = self.distance_to_nearest_hospital(lat, lon)
-        return dist <= radius_km
+        query = _to_float_pair(lat, lon)
+        if query is None:
+            return False
+        return _any_within(self._ensure_hospitals(), query[0], query[1], radius_km)
+
+    def nearest_airports_batch(
+        self, lats: Sequence[float], lons: Sequence[float]
+    ) -> Tuple[List[float], List[Optional[str]]]:
+        """
+        Batch form of distance_to_nearest_airport for many positions at once.
+
+        Returns parallel (distances_km, names) lists; invalid entries get (inf, None).
+        """
+        return _nearest_batch(self._ensure_airports(), self._nearest_airport_cell, lats, lons)
+
+    def nearest_hospitals_batch(
+        self, lats: Sequence[float], lons: Sequence[float]
+    ) -> Tuple[List[float], List[Optional[str]]]:
+        """
+        Batch form of distance_to_nearest_hospital for many positions at once.
+
+        Returns parallel (distances_km, names) lists; invalid entries get (inf, None).
+        """
+        return _nearest_batch(self._ensure_hospitals(), self._nearest_hospital_cell, lats, lons)
+
@@ -3,20 +3,14 @@ Main application entry point for MediTrack GUI.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 
-# Add project root to path
+# Add project root and src/ to path
 project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-if str(Path(__file__).parent.parent) not in sys.path:
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from gui.monitoring_window import MonitoringWindow
-from gui.theme import get_global_stylesheet, FONT_SIZES
+for _path in (str(project_root), str(Path(__file__).parent.parent)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 
 def get_default_config():
@@ -30,10 +24,33 @@ def get_default_config():
     }
 
 
+def _preload_reference_data():
+    """Parse ACFTREF and the airport/hospital CSVs so the first lookups don't have to."""
+    import config
+    from geo_context import GeoContext
+    from gui.model_lookup import ModelLookup
+    # Both modules share parsed tables across instances, so this warms the ones
+    # MonitoringWindow and the monitor worker create later.
+    ModelLookup().preload()
+    GeoContext(config.AIRPORTS_CSV, config.HOSPITALS_CSV).preload()
+
+
 def main():
     """Main application entry point."""
     import traceback
+    # Qt and the window modules are imported here rather than at module scope so
+    # importing gui.main (e.g. for get_default_config) does not load PyQt6.
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QFont
+    from gui.monitoring_window import MonitoringWindow
+    from gui.theme import get_global_stylesheet, FONT_SIZES
     try:
+        # Load reference data off the UI thread while the window is built; a
+        # lookup made before it finishes simply waits for the load.
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(_preload_reference_data)
+        executor.shutdown(wait=False)
+        
         app = QApplication(sys.argv)
         app.setApplicationName("MediTrack")
         app.setOrganizationName("MediTrack")
@@ -5,8 +5,9 @@ Loads ACFTREF.txt file on demand and provides fast lookup of model information.
 """
 
 import csv
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import sys
 
 # Add project root to path for config import
@@ -21,6 +22,11 @@ except (ImportError, AttributeError):
     # Fallback if config not available
     FAA_DATA_DIR = project_root / "ReleasableAircraft"
 
+# Parsed ACFTREF tables shared by all ModelLookup instances, keyed by
+# (path, mtime_ns, size) so a re-downloaded file is parsed again.
+_tables: Dict[Tuple[Path, int, int], Dict[str, Tuple[str, str]]] = {}
+_tables_lock = threading.Lock()
+
 
 class ModelLookup:
     """
@@ -44,74 +50,109 @@ class ModelLookup:
                 acftref_path = FAA_DATA_DIR / "ACFTREF.txt"
         
         self.acftref_path = acftref_path
-        self.lookup_cache: Dict[str, Dict[str, str]] = {}
+        # code -> (manufacturer, model); dicts are only built for lookup() callers
+        self.lookup_cache: Dict[str, Tuple[str, str]] = {}
         self._loaded = False
     
     def _load_acftref(self):
-        """Load ACFTREF.txt file and build lookup dictionary."""
+        """
+        Load ACFTREF.txt and build the lookup dictionary.
+        
+        Thread-safe: the GUI preloads the file in the background at startup, and
+        every ModelLookup for the same unchanged file shares that parsed table.
+        """
         if self._loaded:
             return
         
+        try:
+            stat = self.acftref_path.stat()
+            key = (self.acftref_path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+        
+        with _tables_lock:
+            table = _tables.get(key) if key is not None else None
+            if table is None:
+                table = self._read_acftref()
+                if key is not None:
+                    _tables[key] = table
+        self.lookup_cache = table
+        self._loaded = True
+    
+    def _read_acftref(self) -> Dict[str, Tuple[str, str]]:
+        """Parse ACFTREF.txt into code -> (manufacturer, model); empty if unreadable."""
+        table: Dict[str, Tuple[str, str]] = {}
         if not self.acftref_path.exists():
             # ACFTREF file not found - lookup will return None
-            self._loaded = True
-            return
+            return table
         
         try:
             with open(self.acftref_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                header = next(reader, None)
                 
-                if not reader.fieldnames:
-                    self._loaded = True
-                    return
+                if not header:
+                    return table
                 
-                # Find the actual column keys (handle BOM and variations)
-                code_key = None
-                mfr_key = None
-                model_key = None
+                # Find the column positions once (handle BOM and variations), then
+                # index each row directly instead of building a dict per row
+                code_i = None
+                mfr_i = None
+                model_i = None
                 
-                for key in reader.fieldnames:
-                    if key:
-                        key_clean = key.strip().lstrip('\ufeff')  # Remove BOM
-                        if key_clean == 'CODE':
-                            code_key = key
-                        elif key_clean == 'MFR':
-                            mfr_key = key
-                        elif key_clean == 'MODEL':
-                            model_key = key
+                for i, key in enumerate(header):
+                    key_clean = key.strip().lstrip('\ufeff')  # Remove BOM
+                    if key_clean == 'CODE':
+                        code_i = i
+                    elif key_clean == 'MFR':
+                        mfr_i = i
+                    elif key_clean == 'MODEL':
+                        model_i = i
                 
                 # Fallback: use first few columns if standard names not found
-                if not code_key:
-                    valid_keys = [k for k in reader.fieldnames if k and k.strip()]
-                    if len(valid_keys) >= 3:
-                        code_key = valid_keys[0]
-                        mfr_key = valid_keys[1] if not mfr_key else mfr_key
-                        model_key = valid_keys[2] if not model_key else model_key
+                if code_i is None:
+                    valid_cols = [i for i, key in enumerate(header) if key.strip()]
+                    if len(valid_cols) >= 3:
+                        code_i = valid_cols[0]
+                        mfr_i = valid_cols[1] if mfr_i is None else mfr_i
+                        model_i = valid_cols[2] if model_i is None else model_i
                     else:
-                        # Can't parse file - mark as loaded to avoid retrying
-                        self._loaded = True
-                        return
+                        # Can't parse file - cache it empty to avoid retrying
+                        return table
+                
+                width = max(i for i in (code_i, mfr_i, model_i) if i is not None) + 1
                 
                 # Build lookup dictionary
                 for row in reader:
-                    code = row.get(code_key, '').strip() if code_key else ''
+                    if len(row) < width:
+                        continue
+                    code = row[code_i].strip()
                     if not code:
                         continue
                     
-                    mfr = row.get(mfr_key, '').strip() if mfr_key else ''
-                    model = row.get(model_key, '').strip() if model_key else ''
+                    # Manufacturer and model names repeat across many codes; intern
+                    # them so each distinct name is stored once.
+                    mfr = sys.intern(row[mfr_i].strip()) if mfr_i is not None else ''
+                    model = sys.intern(row[model_i].strip()) if model_i is not None else ''
                     
-                    self.lookup_cache[code] = {
-                        'manufacturer': mfr,
-                        'model': model
-                    }
-            
-            self._loaded = True
+                    table[code] = (mfr, model)
         
-        except Exception as e:
-            # Error loading file - mark as loaded to avoid retrying
-            self._loaded = True
-            # Silently fail - lookup will return None
+        except Exception:
+            # Error loading file - keep what was read and don't retry;
+            # lookup will return None for the rest
+            pass
+        return table
+    
+    def _lookup_entry(self, model_code: str) -> Optional[Tuple[str, str]]:
+        """Return the cached (manufacturer, model) tuple for model_code, or None."""
+        if not model_code or not model_code.strip():
+            return None
+        
+        # Ensure ACFTREF is loaded
+        if not self._loaded:
+            self._load_acftref()
+        
+        return self.lookup_cache.get(model_code.strip())
     
     def lookup(self, model_code: str) -> Optional[Dict[str, str]]:
         """
@@ -123,16 +164,10 @@ class ModelLookup:
         Returns:
             Dictionary with 'manufacturer' and 'model' keys, or None if not found
         """
-        if not model_code or not model_code.strip():
+        entry = self._lookup_entry(model_code)
+        if entry is None:
             return None
-        
-        # Ensure ACFTREF is loaded
-        if not self._loaded:
-            self._load_acftref()
-        
-        # Look up in cache
-        model_code_clean = model_code.strip()
-        return self.lookup_cache.get(model_code_clean)
+        return {'manufacturer': entry[0], 'model': entry[1]}
     
     def get_model_name(self, model_code: str) -> Optional[str]:
         """
@@ -144,9 +179,9 @@ class ModelLookup:
         Returns:
             Model name string, or None if not found
         """
-        info = self.lookup(model_code)
-        if info:
-            return info.get('model')
+        entry = self._lookup_entry(model_code)
+        if entry:
+            return entry[1]
         return None
     
     def get_manufacturer(self, model_code: str) -> Optional[str]:
@@ -159,11 +194,15 @@ class ModelLookup:
         Returns:
             Manufacturer name string, or None if not found
         """
-        info = self.lookup(model_code)
-        if info:
-            return info.get('manufacturer')
+        entry = self._lookup_entry(model_code)
+        if entry:
+            return entry[0]
         return None
     
+    def preload(self):
+        """Load ACFTREF now rather than on the first lookup (e.g. from a background thread)."""
+        self._load_acftref()
+    
     def is_loaded(self) -> bool:
         """Check if ACFTREF has been loaded."""
         return self._loaded
@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QSplitter, QMessageBox, QLabel, QDialog)
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QPixmap
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -24,6 +26,47 @@ from gui.setup_data_dialog import SetupDataDialog
 from gui.theme import COLORS, SPACING, FONT_SIZES, RADIUS, get_button_style
 from gui.model_lookup import ModelLookup
 
+# Minimum spacing between aircraft table refreshes
+_UPDATE_INTERVAL_NS = 100_000_000
+
+# Placeholder values that mean a field was never filled in
+_MISSING_VALUES = frozenset({'UNKNOWN', 'N/A', ''})
+
+
+def _is_missing(value: Optional[str]) -> bool:
+    """True if value is empty or a placeholder such as "Unknown" or "N/A"."""
+    return not value or value.strip().upper() in _MISSING_VALUES
+
+
+# Stylesheets built once per process rather than on every window construction.
+# Sidebar buttons that attach to the bottom of the monitoring info box:
+_ATTACHED_BUTTON_STYLE = get_button_style('primary') + f"""
+            QPushButton {{
+                border-top: none;
+                border-top-left-radius: 0px;
+                border-top-right-radius: 0px;
+                border-bottom-left-radius: {RADIUS['md']}px;
+                border-bottom-right-radius: {RADIUS['md']}px;
+                margin-top: 0px;
+            }}
+        """
+_SECTION_TITLE_STYLE = f"font-size: {FONT_SIZES['md']}px; font-weight: 600; color: {COLORS['text_primary']};"
+_CENTRAL_WIDGET_STYLE = f"background-color: {COLORS['bg_main']};"
+
+# Logo scaled for the sidebar; built on first use since QPixmap needs a QApplication
+_logo_pixmap: Optional[QPixmap] = None
+
+
+def _get_logo_pixmap() -> Optional[QPixmap]:
+    """Return the sidebar logo scaled to 180 px wide, or None if it can't be loaded."""
+    global _logo_pixmap
+    if _logo_pixmap is None and LOGO_PATH.exists():
+        pixmap = QPixmap(str(LOGO_PATH))
+        if not pixmap.isNull():
+            # QPixmap is implicitly shared, so every window reuses these pixels
+            _logo_pixmap = pixmap.scaledToWidth(180, Qt.TransformationMode.SmoothTransformation)
+    return _logo_pixmap
+
 
 class MonitoringWindow(QMainWindow):
     """Main monitoring dashboard window."""
@@ -39,13 +82,18 @@ class MonitoringWindow(QMainWindow):
         self.config = config
         self.worker = None
         self.aircraft_db = []
+        self._db_by_icao = {}  # aircraft_db rows keyed by upper-cased mode_s_hex
+        self._resolved_info = {}  # ICAO24 -> aircraft info resolved from the database alone
         self.active_anomalies = {}  # Track active anomalies by ICAO24
         self.pending_aircraft_update = None
+        self._last_process_ns = 0  # time.monotonic_ns() of the last table refresh
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._process_aircraft_update)
         # Initialize model lookup utility (before init_ui since it's used there)
         self.model_lookup = ModelLookup()
+        # The same few model codes recur all session; callers only read the result
+        self._cached_model_lookup = lru_cache(maxsize=512)(self.model_lookup.lookup)
         self.init_ui()
         self.load_aircraft_database()
         
@@ -65,7 +113,7 @@ class MonitoringWindow(QMainWindow):
         
         # Central widget
         central_widget = QWidget()
-        central_widget.setStyleSheet(f"background-color: {COLORS['bg_main']};")
+        central_widget.setStyleSheet(_CENTRAL_WIDGET_STYLE)
         self.setCentralWidget(central_widget)
         
         # Main layout
@@ -79,11 +127,9 @@ class MonitoringWindow(QMainWindow):
         
         # Logo (top left)
         logo_label = QLabel()
-        if LOGO_PATH.exists():
-            pixmap = QPixmap(str(LOGO_PATH))
-            if not pixmap.isNull():
-                pixmap = pixmap.scaledToWidth(180, Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
+        logo_pixmap = _get_logo_pixmap()
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
         logo_label.setStyleSheet("background: transparent;")
         left_layout.addWidget(logo_label)
@@ -104,35 +150,13 @@ class MonitoringWindow(QMainWindow):
         from PyQt6.QtWidgets import QPushButton
         self.settings_button = QPushButton("Settings")
         # Custom styling to connect seamlessly with monitoring info box
-        settings_style = get_button_style('primary')
-        settings_style += f"""
-            QPushButton {{
-                border-top: none;
-                border-top-left-radius: 0px;
-                border-top-right-radius: 0px;
-                border-bottom-left-radius: {RADIUS['md']}px;
-                border-bottom-right-radius: {RADIUS['md']}px;
-                margin-top: 0px;
-            }}
-        """
-        self.settings_button.setStyleSheet(settings_style)
+        self.settings_button.setStyleSheet(_ATTACHED_BUTTON_STYLE)
         self.settings_button.clicked.connect(self.open_settings)
         left_layout.addWidget(self.settings_button)
         
         # Setup data button (FAA download + build EMS/Police databases)
         self.setup_data_button = QPushButton("Setup data")
-        setup_data_style = get_button_style('primary')
-        setup_data_style += f"""
-            QPushButton {{
-                border-top: none;
-                border-top-left-radius: 0px;
-                border-top-right-radius: 0px;
-                border-bottom-left-radius: {RADIUS['md']}px;
-                border-bottom-right-radius: {RADIUS['md']}px;
-                margin-top: 0px;
-            }}
-        """
-        self.setup_data_button.setStyleSheet(setup_data_style)
+        self.setup_data_button.setStyleSheet(_ATTACHED_BUTTON_STYLE)
         self.setup_data_button.clicked.connect(self.open_setup_data)
         left_layout.addWidget(self.setup_data_button)
         
@@ -149,7 +173,7 @@ class MonitoringWindow(QMainWindow):
         
         # Aircraft table
         aircraft_title = QLabel("Active Aircraft")
-        aircraft_title.setStyleSheet(f"font-size: {FONT_SIZES['md']}px; font-weight: 600; color: {COLORS['text_primary']};")
+        aircraft_title.setStyleSheet(_SECTION_TITLE_STYLE)
         right_layout.addWidget(aircraft_title)
         
         self.aircraft_table = AircraftTable(model_lookup=self.model_lookup)
@@ -157,7 +181,7 @@ class MonitoringWindow(QMainWindow):
         
         # Anomaly list
         anomaly_title = QLabel("Anomalies")
-        anomaly_title.setStyleSheet(f"font-size: {FONT_SIZES['md']}px; font-weight: 600; color: {COLORS['text_primary']};")
+        anomaly_title.setStyleSheet(_SECTION_TITLE_STYLE)
         right_layout.addWidget(anomaly_title)
         
         self.anomaly_list = AnomalyList()
@@ -216,6 +240,81 @@ class MonitoringWindow(QMainWindow):
         except Exception as e:
             self.aircraft_db = []
             QMessageBox.critical(self, "Error", f"Failed to load aircraft database: {e}")
+        self._index_aircraft_db()
+    
+    def _index_aircraft_db(self):
+        """Key aircraft_db rows by normalized hex so lookups skip a scan of the whole list."""
+        by_icao = {}
+        for ac in self.aircraft_db:
+            hex_code = ac.get('mode_s_hex', '').strip().upper()
+            if hex_code:
+                # First row wins, as with the linear search this replaces
+                by_icao.setdefault(hex_code, ac)
+        self._db_by_icao = by_icao
+        self._resolved_info = {}
+    
+    def _resolve_aircraft_info(self, icao24: str, partial: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Return aircraft info for icao24 with missing fields filled from aircraft_db.
+        
+        Fields in partial (anomaly or table data; the database row itself if
+        empty) win unless empty; "Unknown" and "N/A" model names count as missing
+        and are resolved through the model lookup first, then the database.
+        partial is returned unchanged if the aircraft is not in the database.
+        Without partial the result depends only on the database, so it is cached
+        per ICAO24 until the database reloads; callers always get their own copy.
+        """
+        db_info = self._db_by_icao.get(icao24.upper())
+        if not db_info:
+            return partial
+        
+        cacheable = not partial
+        if cacheable and icao24 in self._resolved_info:
+            return dict(self._resolved_info[icao24])
+        
+        aircraft_info = dict(partial) if partial else dict(db_info)
+        
+        # Update missing fields from database
+        for key in ['type_aircraft', 'model_code', 'owner_name', 'owner_city', 'owner_state', 'n_number']:
+            if key not in aircraft_info or not aircraft_info.get(key):
+                aircraft_info[key] = db_info.get(key, 'N/A' if key != 'type_aircraft' else '')
+        
+        # Handle model_name and manufacturer - use model lookup if "Unknown"
+        model_name = aircraft_info.get('model_name', '')
+        manufacturer = aircraft_info.get('manufacturer', '')
+        model_code = aircraft_info.get('model_code', '')
+        
+        # Treat "Unknown" as missing
+        if _is_missing(model_name):
+            model_name = ''
+        if _is_missing(manufacturer):
+            manufacturer = ''
+        
+        # If model name is missing, try model lookup
+        if not model_name and model_code:
+            model_info = self._cached_model_lookup(model_code)
+            if model_info:
+                model_name = model_info.get('model', '')
+                if not manufacturer:
+                    manufacturer = model_info.get('manufacturer', '')
+        
+        # If still missing, get from database
+        if not model_name:
+            db_model = db_info.get('model_name', '')
+            if not _is_missing(db_model):
+                model_name = db_model
+        
+        if not manufacturer:
+            db_mfr = db_info.get('manufacturer', '')
+            if not _is_missing(db_mfr):
+                manufacturer = db_mfr
+        
+        aircraft_info['model_name'] = model_name if model_name else 'N/A'
+        aircraft_info['manufacturer'] = manufacturer if manufacturer else 'N/A'
+        
+        if cacheable:
+            self._resolved_info[icao24] = dict(aircraft_info)
+        return aircraft_info
     
     def start_monitoring(self):
         """Start monitoring."""
@@ -287,6 +386,7 @@ class MonitoringWindow(QMainWindow):
         if setup.exec() == QDialog.DialogCode.Accepted:
             new_config = setup.get_config()
             self.config = new_config
+            self._cached_model_lookup.cache_clear()
             self.load_aircraft_database()
             
             # Restart if was running
@@ -320,108 +420,69 @@ class MonitoringWindow(QMainWindow):
     
     def _on_aircraft_updated(self, aircraft_states: Dict):
         """Handle aircraft update signal (throttled to prevent freezing)."""
-        # Store pending update
+        # Store pending update; only the latest one is kept
         self.pending_aircraft_update = (aircraft_states, self.aircraft_db)
-        
-        # Throttle updates - only process if timer not running
-        if not self.update_timer.isActive():
-            self.update_timer.start(100)  # 100ms delay to batch rapid updates
+        self._schedule_aircraft_update()
+    
+    def _schedule_aircraft_update(self):
+        """
+        Process the pending update now if the last refresh is at least 100 ms old,
+        otherwise start the timer for the rest of that interval.
+        """
+        if self.update_timer.isActive():
+            return
+        due_ns = self._last_process_ns + _UPDATE_INTERVAL_NS - time.monotonic_ns()
+        if due_ns <= 0:
+            self._process_aircraft_update()
+        else:
+            self.update_timer.start(max(1, due_ns // 1_000_000))
     
     def _process_aircraft_update(self):
         """Process pending aircraft update."""
         if self.pending_aircraft_update:
             aircraft_states, aircraft_db = self.pending_aircraft_update
-            self.aircraft_table.update_aircraft(aircraft_states, aircraft_db, set(self.active_anomalies.keys()))
+            anomaly_icao24s = set(self.active_anomalies)
+            self.aircraft_table.update_aircraft(aircraft_states, aircraft_db, anomaly_icao24s)
             
             # Update active flights count
             active_count = len(aircraft_states)
             self.monitoring_info.update_active_flights(active_count)
             
             # Clean up anomalies for aircraft no longer active
-            current_icao24s = set(aircraft_states.keys())
-            inactive_icao24s = set(self.active_anomalies.keys()) - current_icao24s
-            for icao24 in inactive_icao24s:
-                del self.active_anomalies[icao24]
+            if not anomaly_icao24s <= aircraft_states.keys():
+                self.active_anomalies = {
+                    icao24: anomaly for icao24, anomaly in self.active_anomalies.items()
+                    if icao24 in aircraft_states
+                }
             
             self.pending_aircraft_update = None
+            self._last_process_ns = time.monotonic_ns()
     
     def _on_anomaly_detected(self, anomaly: Dict):
         """Handle anomaly detected signal."""
         icao24 = anomaly.get('icao24')
         if icao24:
             # Ensure aircraft_info is complete - supplement from database if needed
-            aircraft_info = anomaly.get('aircraft_info', {})
-            
-            # Try to get full info from database
-            db_info = next(
-                (ac for ac in self.aircraft_db
-                 if ac.get('mode_s_hex', '').strip().upper() == icao24.upper()),
-                None
-            )
-            
-            if db_info:
-                # Merge database info into aircraft_info
-                if not aircraft_info:
-                    aircraft_info = {}
-                
-                # Update missing fields from database
-                for key in ['type_aircraft', 'model_code', 'owner_name', 'owner_city', 'owner_state', 'n_number']:
-                    if key not in aircraft_info or not aircraft_info.get(key):
-                        aircraft_info[key] = db_info.get(key, 'N/A' if key != 'type_aircraft' else '')
-                
-                # Handle model_name and manufacturer - use model lookup if "Unknown"
-                model_name = aircraft_info.get('model_name', '')
-                manufacturer = aircraft_info.get('manufacturer', '')
-                model_code = aircraft_info.get('model_code', '')
-                
-                # Treat "Unknown" as missing
-                if not model_name or model_name.upper().strip() in ['UNKNOWN', 'N/A', '']:
-                    model_name = ''
-                if not manufacturer or manufacturer.upper().strip() in ['UNKNOWN', 'N/A', '']:
-                    manufacturer = ''
-                
-                # If model name is missing, try model lookup
-                if not model_name and model_code:
-                    model_info = self.model_lookup.lookup(model_code)
-                    if model_info:
-                        model_name = model_info.get('model', '')
-                        if not manufacturer:
-                            manufacturer = model_info.get('manufacturer', '')
-                
-                # If still missing, get from database
-                if not model_name:
-                    db_model = db_info.get('model_name', '')
-                    if db_model and db_model.upper().strip() not in ['UNKNOWN', 'N/A', '']:
-                        model_name = db_model
-                
-                if not manufacturer:
-                    db_mfr = db_info.get('manufacturer', '')
-                    if db_mfr and db_mfr.upper().strip() not in ['UNKNOWN', 'N/A', '']:
-                        manufacturer = db_mfr
-                
-                # Update aircraft_info with resolved values
-                aircraft_info['model_name'] = model_name if model_name else 'N/A'
-                aircraft_info['manufacturer'] = manufacturer if manufacturer else 'N/A'
-                
+            aircraft_info = self._resolve_aircraft_info(icao24, anomaly.get('aircraft_info'))
+            if aircraft_info:
                 anomaly['aircraft_info'] = aircraft_info
             
             # Store anomaly for active aircraft
             self.active_anomalies[icao24] = anomaly
         
         self.anomaly_list.add_anomaly(anomaly)
-        # Refresh table so this aircraft row gets anomaly highlight immediately (no wait for next poll)
+        # Refresh table so this aircraft row gets anomaly highlight without waiting for
+        # the next poll; a burst of anomalies shares one throttled refresh, and a
+        # pending update from the latest poll already applies the highlight
         if self.aircraft_table.aircraft_states and self.aircraft_db:
-            self.aircraft_table.update_aircraft(
-                self.aircraft_table.aircraft_states,
-                self.aircraft_db,
-                set(self.active_anomalies.keys())
-            )
+            if not self.pending_aircraft_update:
+                self.pending_aircraft_update = (self.aircraft_table.aircraft_states, self.aircraft_db)
+            self._schedule_aircraft_update()
         # Anomalies are displayed in the anomaly list - no popup needed
     
     def _on_summary_updated(self, poll_count: int, active_aircraft: int, anomalies: int):
         """Handle summary update signal."""
-        self.monitoring_info.update_active_flights(active_aircraft)
-        self.monitoring_info.update_poll_count(poll_count)
+        self.monitoring_info.update_stats(active_aircraft, poll_count)
     
     def _on_error(self, error_msg: str):
         """Handle error signal."""
@@ -451,43 +512,10 @@ class MonitoringWindow(QMainWindow):
         # Get aircraft database info
         aircraft_info = self.aircraft_table.get_aircraft_info(icao24)
         
-        # Also try to get from aircraft_db if not in table data
-        if not aircraft_info:
-            aircraft_info = next(
-                (ac for ac in self.aircraft_db
-                 if ac.get('mode_s_hex', '').strip().upper() == icao24.upper()),
-                None
-            )
-        
-        # Ensure we have all fields from database if available
-        if not aircraft_info or aircraft_info.get('model_name') in ['N/A', 'Unknown', None, '']:
-            # Try to get full info from database
-            db_info = next(
-                (ac for ac in self.aircraft_db
-                 if ac.get('mode_s_hex', '').strip().upper() == icao24.upper()),
-                None
-            )
-            if db_info:
-                # Merge database info, preserving any existing data
-                if not aircraft_info:
-                    aircraft_info = {}
-                # Update missing fields from database
-                for key in ['model_name', 'manufacturer', 'type_aircraft', 'n_number', 
-                           'owner_name', 'owner_city', 'owner_state', 'model_code']:
-                    if key not in aircraft_info or aircraft_info.get(key) in ['N/A', 'Unknown', None, '']:
-                        aircraft_info[key] = db_info.get(key, 'N/A' if key != 'type_aircraft' else '')
-        
-        # If model_name is still missing or "Unknown", try model lookup
-        if aircraft_info and (not aircraft_info.get('model_name') or 
-                              aircraft_info.get('model_name') in ['N/A', 'Unknown', '']):
-            model_code = aircraft_info.get('model_code', '')
-            if model_code and self.model_lookup:
-                model_info = self.model_lookup.lookup(model_code)
-                if model_info:
-                    if not aircraft_info.get('model_name') or aircraft_info.get('model_name') in ['N/A', 'Unknown', '']:
-                        aircraft_info['model_name'] = model_info.get('model', 'N/A')
-                    if not aircraft_info.get('manufacturer') or aircraft_info.get('manufacturer') in ['N/A', 'Unknown', '']:
-                        aircraft_info['manufacturer'] = model_info.get('manufacturer', 'N/A')
+        # Fill missing fields from the database and model lookup if the table
+        # has no info or no usable model name
+        if not aircraft_info or _is_missing(aircraft_info.get('model_name')):
+            aircraft_info = self._resolve_aircraft_info(icao24, aircraft_info)
         
         # Get active anomaly if any
         anomaly = self.active_anomalies.get(icao24)
@@ -82,6 +82,8 @@ class AircraftTable(QTableWidget):
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._process_pending_updates)
         self.active_lookup_workers = []  # Track active workers
+        self._db_source = None  # aircraft_db list that _db_by_icao was built from
+        self._db_by_icao = {}  # aircraft_db rows keyed by upper-cased mode_s_hex
     
     def init_ui(self):
         """Initialize UI components."""
@@ -147,6 +149,15 @@ class AircraftTable(QTableWidget):
             for row in rows_to_remove:
                 self.removeRow(row)
             
+            # Row of each aircraft already in the table, found in one pass
+            # instead of rescanning the rows for every aircraft
+            rows_by_icao24 = {}
+            for row in range(self.rowCount()):
+                item = self.item(row, 1)
+                if item:
+                    rows_by_icao24.setdefault(item.text(), row)
+            db_by_icao = self._index_aircraft_db(aircraft_db)
+            
             # Anomaly row background
             anomaly_brush = None
             if anomaly_icao24s:
@@ -159,19 +170,10 @@ class AircraftTable(QTableWidget):
             # Update or add aircraft
             for icao24, state in aircraft_states.items():
                 # Find existing row (ICAO24 is column 1)
-                existing_row = None
-                for r in range(self.rowCount()):
-                    item = self.item(r, 1)
-                    if item and item.text() == icao24:
-                        existing_row = r
-                        break
+                existing_row = rows_by_icao24.get(icao24)
                 
                 # Find aircraft in database
-                aircraft_info = next(
-                    (ac for ac in aircraft_db
-                     if ac.get('mode_s_hex', '').strip().upper() == icao24.upper()),
-                    None
-                )
+                aircraft_info = db_by_icao.get(icao24.upper())
                 
                 if existing_row is not None:
                     row = existing_row
@@ -368,6 +370,18 @@ class AircraftTable(QTableWidget):
             if was_sorting:
                 self.sortItems(1, Qt.SortOrder.AscendingOrder)
     
+    def _index_aircraft_db(self, aircraft_db: list) -> Dict[str, Dict]:
+        """Return aircraft_db rows keyed by hex, rebuilt only when a different list is passed."""
+        if aircraft_db is not self._db_source:
+            by_icao = {}
+            for ac in aircraft_db:
+                hex_code = ac.get('mode_s_hex', '').strip().upper()
+                if hex_code:
+                    by_icao.setdefault(hex_code, ac)
+            self._db_source = aircraft_db
+            self._db_by_icao = by_icao
+        return self._db_by_icao
+    
     def _process_location_lookup(self):
         """Process one location lookup from queue using background thread."""
         if not hasattr(self, '_location_lookup_queue') or not self._location_lookup_queue:
@@ -108,6 +108,18 @@ class MonitoringInfo(QWidget):
         self.poll_count = count
         self._update_display()
     
+    def update_stats(self, active_flights: int, poll_count: int):
+        """Update active flights and poll count together with a single repaint."""
+        if active_flights == self.active_flights and poll_count == self.poll_count:
+            return
+        self.active_flights = active_flights
+        self.poll_count = poll_count
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_display()
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def _update_display(self):
         """Update all displayed information."""
         # Database type
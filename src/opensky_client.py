@@ -15,6 +15,12 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    # Optional dependency - fall back to stdlib json
+    orjson = None
+
 
 class RateLimiter:
     """Simple rate limiter using token bucket algorithm."""
@@ -800,17 +806,21 @@ def load_ems_aircraft_db(db_path: Path) -> List[Dict]:
         List of aircraft dictionaries
     """
     if db_path.suffix == '.json':
-        with open(db_path, 'r') as f:
-            data = json.load(f)
-            # Handle both formats:
-            # - EMS: {'aircraft': [...]}
-            # - Police: [...] (direct list)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and 'aircraft' in data:
-                return data['aircraft']
-            else:
-                raise ValueError(f"Unexpected JSON format in {db_path}")
+        if orjson is not None:
+            with open(db_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(db_path, 'r') as f:
+                data = json.load(f)
+        # Handle both formats:
+        # - EMS: {'aircraft': [...]}
+        # - Police: [...] (direct list)
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and 'aircraft' in data:
+            return data['aircraft']
+        else:
+            raise ValueError(f"Unexpected JSON format in {db_path}")
     elif db_path.suffix == '.db':
         import sqlite3
         conn = sqlite3.connect(db_path)
@@ -5,6 +5,7 @@ Handles region selection via .env configuration or interactive prompts.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Tuple, List
 from pathlib import Path
 from dotenv import load_dotenv
@@ -15,6 +16,19 @@ from regions import (
 )
 
 
+@lru_cache(maxsize=None)
+def _load_env_file(env_path: Path) -> None:
+    """
+    Load a .env file into os.environ, parsing each path at most once.
+    
+    select_monitoring_area() falls through to select_state()/select_region(),
+    which would otherwise re-read the same file. load_dotenv() never overrides
+    variables already set, so repeated loads had no effect anyway.
+    """
+    if env_path.exists():
+        load_dotenv(env_path)
+
+
 def select_region(project_root: Optional[Path] = None) -> Optional[Region]:
     """
     Select tracking region from .env or interactive prompt.
@@ -27,9 +41,7 @@ def select_region(project_root: Optional[Path] = None) -> Optional[Region]:
     """
     # Load .env if project root provided
     if project_root:
-        env_path = project_root / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_env_file(project_root / ".env")
     
     # Check .env first
     region_name = os.getenv("TRACKING_REGION")
@@ -123,9 +135,7 @@ def select_state(project_root: Optional[Path] = None) -> Optional[List[str]]:
     """
     # Load .env if project root provided
     if project_root:
-        env_path = project_root / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_env_file(project_root / ".env")
     
     # Check .env first
     state_str = os.getenv("MONITOR_STATE")
@@ -213,9 +223,7 @@ def select_region_or_state(project_root: Optional[Path] = None) -> Tuple[Optiona
     """
     # Load .env if project root provided
     if project_root:
-        env_path = project_root / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_env_file(project_root / ".env")
     
     # Check if region or state is specified in .env
     region_name = os.getenv("TRACKING_REGION") or os.getenv("MONITOR_REGION")